@@ -3,6 +3,8 @@ from polycli.orchestration import session, serve_session
 from polycli.builtin_patterns import notify, tell
 from pydantic import BaseModel, Field
 
+from structured_output import recover_structured
+
 class CombatOutcome(BaseModel):
     """DM's structured response for combat actions"""
     description: str = Field(description="What happened in this turn")
@@ -36,8 +38,8 @@ with session() as s:
         )
         print(dm.messages)
         
-        if result.has_data():
-            outcome = result.data
+        outcome = recover_structured(result, CombatOutcome, dm)  # repairs malformed JSON locally first
+        if outcome:
             batman_hp = outcome['batman_hp']
             wolfman_hp = outcome['wolfman_hp']
             notify(batman, outcome['description'])
@@ -54,8 +56,8 @@ with session() as s:
             schema_cls=CombatOutcome
         )
         
-        if result.has_data():
-            outcome = result.data
+        outcome = recover_structured(result, CombatOutcome, dm)  # repairs malformed JSON locally first
+        if outcome:
             batman_hp = outcome['batman_hp']
             wolfman_hp = outcome['wolfman_hp']
             notify(batman, outcome['description'])
@@ -3,6 +3,8 @@ from polycli.orchestration import session, serve_session, pattern
 from polycli.builtin_patterns import notify, tell
 from pydantic import BaseModel, Field
 
+from structured_output import recover_structured
+
 class CombatOutcome(BaseModel):
     """DM's structured response for combat actions"""
     description: str = Field(description="What happened in this turn")
@@ -41,8 +43,8 @@ with session() as s:
         tell(batman, dm, "Your next action against Wolfman.")
         result = dm_evaluate(dm, "Batman", batman_hp, wolfman_hp)  # Now tracked!
         
-        if result.has_data():
-            outcome = result.data
+        outcome = recover_structured(result, CombatOutcome, dm)  # repairs malformed JSON locally first
+        if outcome:
             batman_hp = outcome['batman_hp']
             wolfman_hp = outcome['wolfman_hp']
             notify(batman, outcome['description'])
@@ -55,8 +57,8 @@ with session() as s:
         tell(wolfman, dm, "Your next action against Batman.")
         result = dm_evaluate(dm, "Wolfman", batman_hp, wolfman_hp)  # Now tracked!
         
-        if result.has_data():
-            outcome = result.data
+        outcome = recover_structured(result, CombatOutcome, dm)  # repairs malformed JSON locally first
+        if outcome:
             batman_hp = outcome['batman_hp']
             wolfman_hp = outcome['wolfman_hp']
             notify(batman, outcome['description'])
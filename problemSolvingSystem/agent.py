@@ -1,8 +1,29 @@
 #!/usr/bin/env python3
 from polycli.agent import OpenSourceAgent
+from polycli.builtin_patterns import notify
 from pydantic import BaseModel, Field
 from typing import List, Optional
+from pathlib import Path
+import argparse
+import json
 import sys
+import time
+
+from cadence import ReviewCadence
+from checkpoints import load_checkpoint, save_checkpoint
+from fanout import fan_out, merge_summary
+from governor import ContextGovernor, message_text, replace_prompt_text
+from local_tests import LocalTestGate
+from metrics import InstrumentedAgent, MetricsRecorder, summarize
+from repo_map import RepoMap
+from review_cache import CachedReview, ReviewCache, tree_hash
+from reviewer import PipelinedReviewer
+from rolling_summary import RollingSummary
+from router import ModelRouter
+from snapshots import SnapshotStore
+from structured_output import recover_structured
+from transcript import TranscriptLog
+from validation import RetryLog, run_validated
 
 # Pydantic model for structured review output
 class ReviewResult(BaseModel):
@@ -48,172 +69,459 @@ SYSTEM_PROMPT = """#角色属性
 
 **最重要: 一次只做一点点. 完成一个小功能点, 或者编辑完一个文件后, 立即停下来并等待用户指令.**"""
 
-def agent_loop(max_rounds=20):
-    """Multi-agent loop: Read task.md -> Coder -> Reviewer (Grok-4) -> Refiner"""
-    worker = OpenSourceAgent(system_prompt=SYSTEM_PROMPT, debug=True)
+PROJECT_DIR = Path("putYourPojectHere")
+
+REVIEW_SYSTEM_PROMPT = "你是一个严格的代码审查员，确保实现符合task.md的需求。"
+
+REVIEW_PROMPT = """严格审查当前的实现进度和代码质量，对照task.md的需求。
+请仔细评估：
+1. 所有功能是否都已实现？
+2. 代码质量如何？
+3. 是否有测试？
+4. 还有哪些需要完成的工作？
+
+警告: 只有当整个工程100%完成时，is_complete才能为true。"""
+
+def save_review_result(review, review_result_file):
+    with open(review_result_file, 'w', encoding='utf-8') as f:
+        json.dump({
+            "content": review.content if review else None,
+            "is_success": review.is_success if review else False,
+            "raw_result": review.raw_result if review else None,
+            "has_data": review.has_data() if review else False,
+            "data": review.data if review and review.data else None
+        }, f, indent=2, ensure_ascii=False)
+    print(f"💾 Saved review result to {review_result_file}")
+
+def parse_review(data: Optional[dict]) -> Optional[ReviewResult]:
+    """ReviewResult from structured review data, printing the highlights"""
+    if not data:
+        return None
+    review_data = ReviewResult(**data)
+    print(f"📊 完成度: {review_data.completion_percentage}%")
+    print(f"✅ 是否完成: {review_data.is_complete}")
+    if review_data.issues:
+        print(f"❌ 问题: {', '.join(review_data.issues[:3])}")
+    if review_data.next_steps:
+        print(f"📝 下一步: {', '.join(review_data.next_steps[:3])}")
+    return review_data
+
+def build_refine_prompt(review_data: ReviewResult) -> str:
+    """Build specific refine prompt based on review data"""
+    refine_prompt = "根据审查反馈，需要改进以下方面：\n"
+    if review_data.critical_issues:
+        refine_prompt += f"关键问题：{review_data.critical_issues}\n"
+    if review_data.issues:
+        refine_prompt += f"问题：{', '.join(review_data.issues[:3])}\n"
+    if review_data.next_steps:
+        refine_prompt += f"下一步：{review_data.next_steps[0]}\n"
+    refine_prompt += "请处理最重要的问题，不必一次做完。"
+    return refine_prompt
+
+def agent_loop(max_rounds=20, transcript=True, context_ceiling=100_000, fallback_cli="mini-swe",
+               pipeline_review=False, review_cache=True, snapshots=True, fanout_workers=1,
+               route_models=True, adaptive_review=False, run_tests=True, resume=False,
+               repo_map=True, rolling_summary=True, max_test_skips=2):
+    """Multi-agent loop: Read task.md -> Coder -> Reviewer (Grok-4) -> Refiner
+
+    transcript=True appends only new messages to debug_messages/transcript.jsonl
+    (rebuild any snapshot with transcript.py); False dumps full round_XX_*.json files.
+    context_ceiling bounds the serialized history in bytes (qwen-code fails silently
+    above ~110KB); older rounds are compacted into a summary before it is reached.
+    Empty or repeated results (or a run that raises) are rolled back and retried
+    (compacted, then on fallback_cli, which must be a CLI OpenSourceAgent drives:
+    qwen-code, mini-swe or no-tools); retries are recorded in debug_messages/retries.jsonl.
+    pipeline_review=True reviews a workspace snapshot in the background while the
+    next round builds; the feedback reaches the first refine after it finishes.
+    review_cache=True answers a review from .review_cache.json when task.md and the
+    project tree are byte-identical to an already reviewed state.
+    snapshots=True stores the project tree after every round in .snapshots/
+    (content-addressed; see snapshots.py for list/diff/restore).
+    Every call is timed and its tokens/cost logged to debug_messages/metrics.jsonl
+    (summarized at the end; see metrics.py).
+    fanout_workers > 1 hands independent review next_steps to that many parallel
+    helpers (file leases, private workspace copies) instead of one refine call.
+    route_models=True lets ModelRouter pick each call's model from the stats it
+    keeps in .model_stats.json (candidates/targets in router.json).
+    adaptive_review=True replaces the every-second-round review with ReviewCadence:
+    review once enough files/bytes changed since the last review, or after a max gap.
+    run_tests=True runs the project's pytest files (cached by source hash) before each
+    review; failures are sent back to the builder instead of paying for a review, but at
+    most max_test_skips reviews in a row are skipped that way.
+    resume=True continues from the last round checkpoint in .checkpoints/ (messages,
+    round, last review, workspace snapshot) instead of starting over.
+    repo_map=True attaches a file tree + symbol index of the project (re-parsed only
+    for changed files) to each build prompt, saving exploratory tool calls; only the
+    current map is kept, it is cut from the stored prompt once the build has run.
+    rolling_summary=True condenses every round into a short record
+    (debug_messages/round_summaries.jsonl) and writes the final summary from those
+    records in a fresh no-tools call instead of sending the whole history.
+    """
+    checkpoint = load_checkpoint() if resume else None
+    if resume and checkpoint is None:
+        print("⚠️ No checkpoint found, starting from the beginning")
+    debug_dir = Path("debug_messages")
+    debug_dir.mkdir(exist_ok=True)
+    metrics = MetricsRecorder(debug_dir / "metrics.jsonl", append=bool(checkpoint))
     
-    # Step 0: Read requirements from task.md
-    print("📖 Reading requirements from task.md...")
-    result = worker.run("请阅读task.md文件，理解需求。这是一个信息网络类刷题系统的完整需求文档。")
-    print(result.content)
+    worker = ContextGovernor(
+        InstrumentedAgent(OpenSourceAgent(system_prompt=SYSTEM_PROMPT, debug=True), metrics),
+        ceiling_bytes=context_ceiling
+    )
+    transcript_log = TranscriptLog(debug_dir, append=bool(checkpoint)) if transcript else None
     
-    # Step 1: Initial implementation
-    print("\n👨‍💻 Coder starting implementation...")
-    result = worker.run("基于task.md的需求，开始实现这个刷题系统。先创建README。注意包括 README 的所有项目文件都应该放在 putYourPojectHere 子文件下.")
-    print(result.content)
+    def save_messages(label):
+        """Checkpoint worker.messages under label (delta log or full dump)"""
+        if transcript_log:
+            written = transcript_log.checkpoint(label, worker.messages)
+            print(f"💾 Logged {written} new messages as {label}")
+        else:
+            messages_file = debug_dir / f"{label}.json"
+            with open(messages_file, 'w', encoding='utf-8') as f:
+                json.dump(worker.messages, f, indent=2, ensure_ascii=False)
+            print(f"💾 Saved messages to {messages_file}")
     
-    for round in range(max_rounds):
-        print(f"\n🔄 Round {round + 1}/{max_rounds}")
+    reviewer = PipelinedReviewer(ReviewResult, system_prompt=REVIEW_SYSTEM_PROMPT) if pipeline_review else None
+    pending_key = None
+    review_cache = ReviewCache() if review_cache else None
+    
+    snapshot_store = SnapshotStore(PROJECT_DIR) if snapshots else None
+    
+    def take_snapshot(round_num):
+        if snapshot_store:
+            stats = snapshot_store.snapshot(round_num)
+            print(f"📸 Snapshot round {round_num}: {stats['files']} files, "
+                  f"{stats['new_objects']} new objects ({stats['new_bytes']} bytes)")
+    
+    project_map = RepoMap(PROJECT_DIR) if repo_map else None
+    test_gate = LocalTestGate(PROJECT_DIR) if run_tests else None
+    if test_gate and not test_gate.available:
+        test_gate = None
+    test_skips = 0  # reviews skipped in a row because tests failed
+    cadence = ReviewCadence(PROJECT_DIR, store=snapshot_store) if adaptive_review else None
+    
+    retry_log = RetryLog(debug_dir / "retries.jsonl")
+    last_content = None
+    
+    router = ModelRouter() if route_models else None
+    round_log = RollingSummary(debug_dir / "round_summaries.jsonl", append=bool(checkpoint)) if rolling_summary else None
+    
+    def run_checked(prompt, label, call_type="continue"):
+        """worker.run() with model routing and silent-failure rollback and retry"""
+        nonlocal last_content
+        model = router.choose(call_type) if router else None
+        kwargs = {"model": model} if model else {}
+        start = time.time()
+        result = run_validated(worker, prompt, last_content, retry_log, label, fallback_cli=fallback_cli, **kwargs)
+        if router:
+            router.record(call_type, model, time.time() - start, result)
+        if result is not None and result.content:
+            last_content = result.content
+            if round_log:
+                round_log.add(label, result.content)
+        return result
+    
+    last_review, approved = None, False
+    
+    def close_round(round_num, review_dict=None):
+        """Condense the round into its rolling summary record"""
+        if not round_log:
+            return
+        changes = None
+        if snapshot_store and round_num > 0:
+            try:
+                changes = snapshot_store.diff(round_num - 1, round_num)
+            except KeyError:
+                pass
+        round_log.close_round(round_num, changes=changes, review=review_dict)
+    
+    def save_round(round_num):
+        """Durable checkpoint of everything needed to continue after round_num"""
+        save_checkpoint({
+            "round": round_num,
+            "messages": list(worker.messages),
+            "last_content": last_content,
+            "last_review": last_review,
+            "approved": approved,
+            "test_skips": test_skips,
+            "snapshot_round": round_num if snapshot_store else None,
+            "cadence": {"last_review_round": cadence.last_review_round, "baseline": cadence.baseline} if cadence else None,
+        })
+    
+    start_round = 0
+    if checkpoint:
+        start_round = checkpoint["round"]
+        worker.messages = checkpoint["messages"]
+        last_content = checkpoint["last_content"]
+        last_review, approved = checkpoint["last_review"], checkpoint["approved"]
+        test_skips = checkpoint.get("test_skips", 0)
+        if snapshot_store and checkpoint["snapshot_round"] is not None:
+            changes = snapshot_store.restore(checkpoint["snapshot_round"])
+            print(f"⏪ Workspace restored to round {checkpoint['snapshot_round']}: "
+                  + ", ".join(f"{len(v)} {k}" for k, v in changes.items()))
+        if cadence and checkpoint["cadence"]:
+            cadence.last_review_round = checkpoint["cadence"]["last_review_round"]
+            cadence.baseline = checkpoint["cadence"]["baseline"]
+        metrics.tag(start_round, "setup")
+        print(f"▶️ Resuming after round {start_round} ({len(worker.messages)} messages, saved {checkpoint['saved_at']})")
+    else:
+        # Step 0: Read requirements from task.md
+        print("📖 Reading requirements from task.md...")
+        result = run_checked("请阅读task.md文件，理解需求。这是一个信息网络类刷题系统的完整需求文档。", "read_task")
+        print(result.content if result else "No result!")
         
-        # Debug: Save messages to JSON file
-        import json
-        from pathlib import Path
-        debug_dir = Path("debug_messages")
-        debug_dir.mkdir(exist_ok=True)
+        # Step 1: Initial implementation
+        print("\n👨‍💻 Coder starting implementation...")
+        result = run_checked("基于task.md的需求，开始实现这个刷题系统。先创建README。注意包括 README 的所有项目文件都应该放在 putYourPojectHere 子文件下.", "initial_build")
+        print(result.content if result else "No result!")
+        take_snapshot(0)
+        close_round(0)
+        save_round(0)
+    
+    for round in range(start_round, max_rounds):
+        if approved:
+            break
+        print(f"\n🔄 Round {round + 1}/{max_rounds}")
         
         # Save messages before running
-        messages_file = debug_dir / f"round_{round+1:02d}_before.json"
-        with open(messages_file, 'w', encoding='utf-8') as f:
-            json.dump(worker.messages, f, indent=2, ensure_ascii=False)
-        print(f"💾 Saved messages to {messages_file}")
+        save_messages(f"round_{round+1:02d}_before")
         
         # Debug: Print ALL messages
         print(f"\n📝 Total messages: {len(worker.messages)}")
         print("=" * 50)
         for i, msg in enumerate(worker.messages):
             role = msg.get('role', 'unknown')
-            # Handle different message formats
-            if 'parts' in msg:
-                # Qwen format
-                parts = msg.get('parts', [])
-                if parts and isinstance(parts[0], dict):
-                    content = str(parts[0].get('text', 'no text'))[:200]
-                else:
-                    content = str(parts)[:200]
-            else:
-                # Simple format
-                content = str(msg.get('content', 'no content'))[:200]
+            content = message_text(msg)[:200] or 'no content'
             print(f"[{i}] {role}: {content}...")
         print("=" * 50)
         
         # Continue building
         print("🏗️ Building system...")
-        result = worker.run("继续构建系统, 增加下一个小功能点. 不要一次做太多, 及时停下来.")
-        print(result.content)
+        metrics.tag(round + 1, "build")
+        build_prompt = "继续构建系统, 增加下一个小功能点. 不要一次做太多, 及时停下来."
+        map_block = None
+        if project_map:
+            parsed = project_map.update()
+            print(f"🗺️ Repo map updated ({parsed} files re-parsed)")
+            map_block = f"\n\n当前项目结构与符号索引（自动生成，无需再逐个列目录）：\n{project_map.render()}"
+            build_prompt += map_block
+        result = run_checked(build_prompt, f"round_{round+1:02d}_build")
+        print(result.content if result else "No result!")
+        if map_block:
+            # Only the current map is worth sending: drop it from the stored prompt so stale
+            # maps don't pile up in the history (each round attaches a fresh one)
+            messages = worker.messages
+            if replace_prompt_text(messages, map_block, "\n\n（本轮附带的项目结构图已省略）"):
+                worker.messages = messages
         
         # Save messages after running
-        messages_file_after = debug_dir / f"round_{round+1:02d}_after.json"
-        with open(messages_file_after, 'w', encoding='utf-8') as f:
-            json.dump(worker.messages, f, indent=2, ensure_ascii=False)
-        print(f"💾 Saved messages after to {messages_file_after}")
+        save_messages(f"round_{round+1:02d}_after")
         
         # Also save the raw result
         result_file = debug_dir / f"round_{round+1:02d}_result.json"
         with open(result_file, 'w', encoding='utf-8') as f:
             json.dump({
-                "content": result.content,
-                "is_success": result.is_success,
-                "raw_result": result.raw_result,
-                "error_message": result.error_message
+                "content": result.content if result else None,
+                "is_success": result.is_success if result else False,
+                "raw_result": result.raw_result if result else None,
+                "error_message": result.error_message if result else None
             }, f, indent=2, ensure_ascii=False)
         print(f"💾 Saved result to {result_file}")
+        take_snapshot(round + 1)
         
-        # Review with Grok-4 every 2 rounds
-        if round % 2 == 1:
-            print("👀 Reviewer (glm-4.5) checking with structured output...")
-            review = worker.run(
-                """严格审查当前的实现进度和代码质量，对照task.md的需求。
-                请仔细评估：
-                1. 所有功能是否都已实现？
-                2. 代码质量如何？
-                3. 是否有测试？
-                4. 还有哪些需要完成的工作？
-                
-                警告: 只有当整个工程100%完成时，is_complete才能为true。""",
-                model="glm-4.5",
-                system_prompt="你是一个严格的代码审查员，确保实现符合task.md的需求。",
-                cli="no-tools",  # Use no-tools mode for structured output
-                schema_cls=ReviewResult
-            )
-            
+        # Review with Grok-4 every 2 rounds, or when enough changed (adaptive_review)
+        if cadence:
+            review_due, reason = cadence.should_review(round + 1)
+            print(f"📏 Review {'due' if review_due else 'not due'}: {reason}")
+        else:
+            review_due = round % 2 == 1
+        
+        # Run the project's own tests first: failures go straight to the builder,
+        # otherwise the results are handed to the reviewer
+        review_prompt = REVIEW_PROMPT
+        if review_due and test_gate:
+            test_report = test_gate.run()
+            print(f"🧪 {test_report.summary().splitlines()[0]}")
+            if test_report.errors:
+                print(f"⚠️ pytest could not run {len(test_report.errors)} test files, not treating them as failures")
+            if test_report.failed and test_skips < max_test_skips:
+                test_skips += 1
+                print(f"🔧 Skipping review, fixing failing tests first ({test_skips}/{max_test_skips})...")
+                metrics.tag(round + 1, "refine")
+                fix_result = run_checked(f"{test_report.summary()}\n\n请先修复这些失败的测试，不必一次全部修完。",
+                                         f"round_{round+1:02d}_fix_tests", "refine")
+                print(fix_result.content if fix_result else "No fix result!")
+                take_snapshot(round + 1)
+                review_due = False
+            else:
+                test_skips = 0
+                review_prompt = f"{REVIEW_PROMPT}\n\n{test_report.summary()}"
+        review, review_round, review_key = None, None, None
+        repair_agent, review_model, review_dict = None, None, None  # only a fresh synchronous review can re-ask for fields
+        if pipeline_review:
+            # Pick up the background review of an earlier round, then start the next one
+            review_round, review = reviewer.collect()
+            if review_round is not None:
+                review_key, pending_key = pending_key, None
+                metrics.record(reviewer.last_seconds or 0.0, review, backend="no-tools",
+                               model=reviewer.last_model, phase="review", round_num=review_round)
+                if router:
+                    router.record("review", reviewer.last_model, reviewer.last_seconds or 0.0, review,
+                                  success=bool(review and review.data))
+            if review_due:
+                key = tree_hash(PROJECT_DIR, extra=review_prompt)
+                cached = review_cache.get(key) if review_cache else None
+                if cached and review_round is None:
+                    print("♻️ Workspace unchanged since a cached review, reusing it")
+                    review, review_round = cached, round + 1
+                elif not cached and not reviewer.busy and round + 1 < max_rounds:
+                    # (no new background review on the last round: nothing would be left to use it)
+                    reviewer.model = router.choose("review") if router else "glm-4.5"
+                    reviewer.submit(round + 1, review_prompt, PROJECT_DIR)
+                    print(f"👀 Reviewer ({reviewer.model or 'default'}) reviewing round {round + 1} in the background...")
+                    pending_key = key
+                if cadence and (cached or pending_key == key):
+                    cadence.mark_reviewed(round + 1)
+        elif review_due:
+            if cadence:
+                cadence.mark_reviewed(round + 1)
+            review_round = round + 1
+            review_key = tree_hash(PROJECT_DIR, extra=review_prompt)
+            review = review_cache.get(review_key) if review_cache else None
+            if review:
+                print("♻️ Workspace unchanged since a cached review, reusing it")
+            else:
+                review_model = router.choose("review") if router else "glm-4.5"
+                print(f"👀 Reviewer ({review_model or 'default'}) checking with structured output...")
+                metrics.tag(round + 1, "review")
+                start = time.time()
+                review = worker.run(
+                    review_prompt,
+                    model=review_model,
+                    system_prompt=REVIEW_SYSTEM_PROMPT,
+                    cli="no-tools",  # Use no-tools mode for structured output
+                    schema_cls=ReviewResult
+                )
+                repair_agent = worker
+                if router:
+                    router.record("review", review_model, time.time() - start, review,
+                                  success=bool(review and review.data))
+        
+        if review_round is not None:
             # Debug: Save review result and messages
-            review_result_file = debug_dir / f"round_{round+1:02d}_review_result.json"
-            with open(review_result_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    "content": review.content if review else None,
-                    "is_success": review.is_success if review else False,
-                    "raw_result": review.raw_result if review else None,
-                    "has_data": review.has_data() if review else False,
-                    "data": review.data if review and review.data else None
-                }, f, indent=2, ensure_ascii=False)
-            print(f"💾 Saved review result to {review_result_file}")
+            save_review_result(review, debug_dir / f"round_{review_round:02d}_review_result.json")
             
             # Save messages after review
-            messages_file_after_review = debug_dir / f"round_{round+1:02d}_after_review.json"
-            with open(messages_file_after_review, 'w', encoding='utf-8') as f:
-                json.dump(worker.messages, f, indent=2, ensure_ascii=False)
-            print(f"💾 Saved messages after review to {messages_file_after_review}")
+            save_messages(f"round_{round+1:02d}_after_review")
             
             # Debug: Print messages after review
             print(f"\n📝 After review - Total messages: {len(worker.messages)}")
             if len(worker.messages) > 0:
                 last_msg = worker.messages[-1]
                 role = last_msg.get('role', 'unknown')
-                if 'parts' in last_msg:
-                    parts = last_msg.get('parts', [])
-                    if parts and isinstance(parts[0], dict):
-                        content = str(parts[0].get('text', 'no text'))[:300]
-                    else:
-                        content = str(parts)[:300]
-                else:
-                    content = str(last_msg.get('content', 'no content'))[:300]
+                content = message_text(last_msg)[:300] or 'no content'
                 print(f"Last message - {role}: {content}...")
             
-            review_data = None
-            if review and review.data:
-                review_data = ReviewResult(**review.data)
-                print(f"📊 完成度: {review_data.completion_percentage}%")
-                print(f"✅ 是否完成: {review_data.is_complete}")
-                if review_data.issues:
-                    print(f"❌ 问题: {', '.join(review_data.issues[:3])}")
-                if review_data.next_steps:
-                    print(f"📝 下一步: {', '.join(review_data.next_steps[:3])}")
-                
-                if review_data.is_complete and review_data.completion_percentage >= 95:
-                    print("✅ System approved by reviewer! All requirements completed!")
-                    break
-            else:
+            review_dict = recover_structured(review, ReviewResult, repair_agent, model=review_model,
+                                             system_prompt=REVIEW_SYSTEM_PROMPT)
+            review_data = parse_review(review_dict)
+            if review_data is None:
                 print("⚠️ Failed to get structured review result")
-                continue
+            elif review_data.is_complete and review_data.completion_percentage >= 95:
+                print("✅ System approved by reviewer! All requirements completed!")
+                approved = True
+            
+            if review_data is not None:
+                last_review = review_dict
+                if review_cache and review_key and not isinstance(review, CachedReview):
+                    review_cache.put(review_key, review_dict)
             
             # Refine based on feedback
-            if review_data and review_data.should_continue():
-                print("🔧 Refining based on review...")
-                
-                # Build specific refine prompt based on review data
-                refine_prompt = "根据审查反馈，需要改进以下方面：\n"
-                if review_data.critical_issues:
-                    refine_prompt += f"关键问题：{review_data.critical_issues}\n"
-                if review_data.issues:
-                    refine_prompt += f"问题：{', '.join(review_data.issues[:3])}\n"
-                if review_data.next_steps:
-                    refine_prompt += f"下一步：{review_data.next_steps[0]}\n"
-                refine_prompt += "请处理最重要的问题，不必一次做完。"
-                
-                refine_result = worker.run(refine_prompt)
-                print(refine_result.content if refine_result else "No refine result!")
+            if review_data is not None and review_data.should_continue():
+                metrics.tag(round + 1, "refine")
+                if fanout_workers > 1 and len(review_data.next_steps) > 1:
+                    print(f"🔀 Fanning out {len(review_data.next_steps)} next steps to up to {fanout_workers} workers...")
+                    context = f"审查指出的关键问题：{review_data.critical_issues}" if review_data.critical_issues else ""
+                    report = fan_out(review_data.next_steps, PROJECT_DIR, SYSTEM_PROMPT,
+                                     context=context, max_workers=fanout_workers,
+                                     recorder=metrics, round_num=round + 1)
+                    for worker_id, r in report.items():
+                        print(f"  {worker_id}: merged {len(r['accepted'])} files, rejected {len(r['rejected'])}")
+                    notify(worker, merge_summary(report))
+                    if round_log:
+                        round_log.add("fanout", merge_summary(report))
+                else:
+                    print(f"🔧 Refining based on review of round {review_round}...")
+                    refine_result = run_checked(build_refine_prompt(review_data), f"round_{round+1:02d}_refine", "refine")
+                    print(refine_result.content if refine_result else "No refine result!")
+                take_snapshot(round + 1)
+        
+        close_round(round + 1, review_dict)
+        save_round(round + 1)
+        if approved:
+            break
+    
+    if reviewer:
+        # A review still in flight can't be cancelled and is already paid for: use it
+        review_round, review = reviewer.collect(wait=True)
+        if review_round is not None:
+            print(f"⏳ Collected the background review of round {review_round}")
+            save_review_result(review, debug_dir / f"round_{review_round:02d}_review_result.json")
+            metrics.record(reviewer.last_seconds or 0.0, review, backend="no-tools",
+                           model=reviewer.last_model, phase="review", round_num=review_round)
+            if router:
+                router.record("review", reviewer.last_model, reviewer.last_seconds or 0.0, review,
+                              success=bool(review and review.data))
+            review_dict = recover_structured(review, ReviewResult)
+            review_data = parse_review(review_dict)
+            if review_data is not None:
+                last_review = review_dict
+                if review_cache and pending_key:
+                    review_cache.put(pending_key, review_dict)
+                if review_data.is_complete and review_data.completion_percentage >= 95:
+                    print("✅ System approved by reviewer! All requirements completed!")
+                    approved = True
+        reviewer.shutdown()
     
     # Final summary
     print("\n" + "="*50)
-    summary = worker.run("总结系统的实现情况，列出已完成的核心功能。", model="gpt-4o")
+    summary_model = router.choose("summary") if router else "gpt-4o"
+    metrics.tag(metrics.round, "summary")
+    start = time.time()
+    if round_log and round_log.records:
+        # Built from the per-round records, so the cost does not grow with the rounds
+        summary_prompt = f"以下是每一轮开发的简要记录：\n\n{round_log.render()}"
+        if project_map:
+            project_map.update()
+            summary_prompt += f"\n\n当前项目结构：\n{project_map.render()}"
+        summary_prompt += "\n\n根据这些记录总结系统的实现情况，列出已完成的核心功能。"
+        summarizer = InstrumentedAgent(OpenSourceAgent(), metrics)
+        summary = summarizer.run(summary_prompt, model=summary_model, cli="no-tools")
+    else:
+        summary = worker.run("总结系统的实现情况，列出已完成的核心功能。", model=summary_model)
+    if router:
+        router.record("summary", summary_model, time.time() - start, summary)
     if summary:
         print(f"📋 最终交付:\n{summary.content}")
+    if worker.stats:
+        peak = max(r["bytes_before"] for r in worker.stats)
+        print(f"🗜️ Context: peak {peak // 1024}KB, {worker.compactions} compactions over {len(worker.stats)} calls")
+    print(f"⏱️ Metrics ({metrics.metrics_file}):\n{summarize(metrics.records)}")
+    if router:
+        print(f"🧭 Model stats:\n{router.report()}")
+    if retry_log.records:
+        print(f"♻️ {len(retry_log.records)} silent failures retried (see {retry_log.log_file})")
     print("="*50)
 
 def main():
+    parser = argparse.ArgumentParser(description="Agent Loop System - Building from task.md")
+    parser.add_argument("--rounds", type=int, default=20, help="maximum number of build rounds")
+    parser.add_argument("--resume", action="store_true", help="continue from the last completed round")
+    args = parser.parse_args()
+    
     print("🤖 Agent Loop System - Building from task.md")
     print("="*50)
-    agent_loop()  # Now reads from task.md directly
+    agent_loop(max_rounds=args.rounds, resume=args.resume)  # Now reads from task.md directly
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Adaptive review cadence driven by change volume.
+
+Instead of reviewing every second round, ReviewCadence measures how much of the
+project changed since the last review (files touched, bytes of changed lines) and
+asks for a review only when a threshold is crossed or too many rounds have passed.
+"""
+
+import difflib
+from pathlib import Path
+
+from snapshots import compare_manifests, scan_tree
+
+
+def changed_bytes(old: bytes, new: bytes) -> int:
+    """Bytes on added/removed lines between two versions of a file"""
+    try:
+        old_lines = old.decode("utf-8").splitlines()
+        new_lines = new.decode("utf-8").splitlines()
+    except UnicodeDecodeError:
+        return max(len(old), len(new))  # binary: count it as fully changed
+    total = 0
+    for line in difflib.unified_diff(old_lines, new_lines, lineterm="", n=0):
+        if line.startswith(("+++", "---", "@@")):
+            continue
+        total += len(line.encode("utf-8"))
+    return total
+
+
+class ReviewCadence:
+    """Decides per round whether the accumulated change is worth a review"""
+
+    def __init__(self, project_dir: Path, store=None, min_changed_files: int = 3,
+                 min_changed_bytes: int = 4000, max_gap: int = 4):
+        self.project_dir = Path(project_dir)
+        self.store = store                  # SnapshotStore, for the old contents of modified files
+        self.min_changed_files = min_changed_files
+        self.min_changed_bytes = min_changed_bytes
+        self.max_gap = max_gap
+        self.baseline = {}                  # manifest at the last review
+        self.last_review_round = 0
+        self._current = {}
+
+    def measure(self) -> dict:
+        """Files and bytes changed since the last review"""
+        self._current = scan_tree(self.project_dir, self._current)
+        changes = compare_manifests(self.baseline, self._current)
+        total = sum(self._current[p]["size"] for p in changes["added"])
+        total += sum(self.baseline[p]["size"] for p in changes["removed"])
+        for path in changes["modified"]:
+            old = self.store.read_object(self.baseline[path]["sha"]) if self.store else None
+            if old is None:
+                total += self._current[path]["size"]
+            else:
+                total += changed_bytes(old, (self.project_dir / path).read_bytes())
+        files = sum(len(v) for v in changes.values())
+        return {"files": files, "bytes": total}
+
+    def should_review(self, round_num: int):
+        """(due, reason) for a review at the end of round_num"""
+        change = self.measure()
+        gap = round_num - self.last_review_round
+        if change["files"] >= self.min_changed_files:
+            return True, f"{change['files']} files changed"
+        if change["bytes"] >= self.min_changed_bytes:
+            return True, f"{change['bytes']} bytes changed"
+        if gap >= self.max_gap and change["files"] > 0:
+            return True, f"{gap} rounds since last review"
+        return False, f"only {change['files']} files / {change['bytes']} bytes changed in {gap} rounds"
+
+    def mark_reviewed(self, round_num: int):
+        self.baseline = dict(self._current) if self._current else scan_tree(self.project_dir)
+        self.last_review_round = round_num
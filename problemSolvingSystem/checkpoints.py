@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Durable round checkpoints for agent_loop.
+
+After every completed round the loop state (worker messages, round counter, last
+review data, snapshot id, review cadence baseline) is written atomically to
+.checkpoints/latest.json, with the previous checkpoint kept as previous.json.
+`python agent.py --resume` continues from there without re-running any round.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+CHECKPOINT_DIR = Path(".checkpoints")
+
+
+def save_checkpoint(state: dict, checkpoint_dir: Path = CHECKPOINT_DIR) -> Path:
+    checkpoint_dir.mkdir(exist_ok=True)
+    latest = checkpoint_dir / "latest.json"
+    tmp = checkpoint_dir / "latest.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({**state, "saved_at": time.strftime("%Y-%m-%d %H:%M:%S")}, f, ensure_ascii=False)
+        f.flush()
+        os.fsync(f.fileno())
+    if latest.exists():
+        os.replace(latest, checkpoint_dir / "previous.json")
+    os.replace(tmp, latest)
+    return latest
+
+
+def load_checkpoint(checkpoint_dir: Path = CHECKPOINT_DIR):
+    """Latest readable checkpoint, falling back to the previous one; None if there is none"""
+    for name in ("latest.json", "previous.json"):
+        path = checkpoint_dir / name
+        if path.exists():
+            try:
+                return json.loads(path.read_text(encoding="utf-8"))
+            except json.JSONDecodeError:
+                print(f"⚠️ Checkpoint {path} is unreadable, trying the previous one")
+    return None
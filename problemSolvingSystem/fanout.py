@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Fan-out of reviewer next_steps to parallel helper workers.
+
+Steps that mention the same project files are grouped, and each group gets its
+own helper agent, a private copy of the workspace and a lease on the files its
+steps mention. After the batch, helper changes are merged back into the real
+workspace: a change to a file leased by another helper, or to a file an earlier
+helper already changed, is rejected and reported instead of silently overwriting.
+"""
+
+import re
+import shutil
+from pathlib import Path
+
+from polycli.agent import OpenSourceAgent
+from polycli.orchestration import session, pattern, batch
+
+from metrics import InstrumentedAgent, MetricsRecorder
+from snapshots import SKIP_DIRS, compare_manifests, scan_tree
+
+# ASCII only: \w would also match CJK, turning "修复app.py中的登录" into the token "修复app.py"
+PATH_PATTERN = re.compile(r"[A-Za-z0-9_./-]+\.[A-Za-z0-9]{1,6}")
+
+
+def mentioned_files(step: str, known_files) -> set:
+    """Project files a step refers to, by full relative path or by file name"""
+    by_name = {}
+    for key in known_files:
+        by_name.setdefault(Path(key).name, set()).add(key)
+    found = set()
+    for token in PATH_PATTERN.findall(step):
+        token = token.strip("./")
+        if token in known_files:
+            found.add(token)
+        else:
+            found |= by_name.get(Path(token).name, set())
+    return found
+
+
+def group_steps(steps, known_files, max_workers: int) -> list:
+    """[(steps, leased_files)]: steps sharing a file land in the same group
+
+    Once max_workers groups exist, further independent steps join the smallest group
+    rather than being dropped.
+    """
+    groups = []
+    for step in steps:
+        files = mentioned_files(step, known_files)
+        for group, group_files in groups:
+            if files & group_files:
+                group.append(step)
+                group_files |= files
+                break
+        else:
+            if len(groups) < max_workers:
+                groups.append(([step], set(files)))
+            else:
+                group, group_files = min(groups, key=lambda g: len(g[0]))
+                group.append(step)
+                group_files |= files
+    return groups
+
+
+class FileLeases:
+    """Which helper holds which file; a file has at most one holder"""
+
+    def __init__(self):
+        self.holders = {}
+
+    def acquire(self, worker_id: str, files) -> set:
+        """Lease every free file in files to worker_id; returns the files granted"""
+        granted = {f for f in files if self.holders.get(f, worker_id) == worker_id}
+        for f in granted:
+            self.holders[f] = worker_id
+        return granted
+
+    def allows(self, worker_id: str, path: str) -> bool:
+        return self.holders.get(path, worker_id) == worker_id
+
+
+@pattern
+def implement_steps(helper: OpenSourceAgent, prompt: str) -> str:
+    """One helper works through its group of next steps"""
+    result = helper.run(prompt)
+    if not result:
+        return "Failed: No result from agent"
+    if not result.is_success:
+        return f"Failed: {result.error_message}"
+    return result.content if result.content else "No content returned"
+
+
+def fan_out(steps, project_dir: Path, system_prompt: str, context: str = "",
+            max_workers: int = 3, work_root: Path = Path(".fanout"),
+            recorder: MetricsRecorder = None, round_num: int = None) -> dict:
+    """Run one helper per independent step group and merge their edits into project_dir
+
+    With a recorder, every helper call is logged as a "refine" call of round_num.
+    """
+    project_dir = Path(project_dir)
+    project_dir.mkdir(exist_ok=True)
+    base = scan_tree(project_dir)
+    groups = group_steps(steps, base.keys(), max_workers)
+    leases = FileLeases()
+
+    if work_root.exists():
+        shutil.rmtree(work_root)
+    helpers = []
+    for i, (group, files) in enumerate(groups, 1):
+        worker_id = f"helper_{i}"
+        workspace = work_root / worker_id / project_dir.name
+        shutil.copytree(project_dir, workspace, ignore=shutil.ignore_patterns(*SKIP_DIRS))
+        owned = leases.acquire(worker_id, files)
+        helpers.append((worker_id, group, workspace, owned))
+
+    if recorder and round_num is not None:
+        recorder.tag(round_num, "refine")
+    results = {}
+    with session(max_workers=len(helpers)):
+        with batch():
+            for worker_id, group, workspace, owned in helpers:
+                others = sorted(set(leases.holders) - owned)
+                prompt = f"""你是并行开发小组中的 {worker_id}。{context}
+你的工作目录是 {workspace}（项目 {project_dir} 的副本），只在这个目录里修改文件。
+
+需要完成的任务：
+{chr(10).join(f"- {step}" for step in group)}
+
+你独占的文件：{', '.join(sorted(owned)) or '（无，可新建文件）'}
+其他人正在修改、你不能改动的文件：{', '.join(others) or '（无）'}
+完成后简要说明改了哪些文件。"""
+                helper = OpenSourceAgent(id=worker_id, system_prompt=system_prompt)
+                if recorder:
+                    helper = InstrumentedAgent(helper, recorder)
+                results[worker_id] = implement_steps(helper, prompt)
+
+    # Merge helper workspaces back in order; first writer of an unleased file wins
+    touched, report = set(), {}
+    for worker_id, group, workspace, owned in helpers:
+        changes = compare_manifests(base, scan_tree(workspace))
+        accepted, rejected = [], []
+        for kind in ("added", "modified", "removed"):
+            for path in changes[kind]:
+                if not leases.allows(worker_id, path) or path in touched:
+                    rejected.append(path)
+                    continue
+                target = project_dir / path
+                if kind == "removed":
+                    target.unlink(missing_ok=True)
+                else:
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    shutil.copyfile(workspace / path, target)
+                touched.add(path)
+                accepted.append(path)
+        report[worker_id] = {"steps": group, "result": str(results.get(worker_id, "")),
+                             "accepted": accepted, "rejected": rejected}
+    shutil.rmtree(work_root, ignore_errors=True)
+    return report
+
+
+def merge_summary(report: dict) -> str:
+    """Message for the main worker describing what the helpers did"""
+    lines = ["并行小组已完成以下工作（改动已合并到项目中）："]
+    for worker_id, r in report.items():
+        lines.append(f"\n[{worker_id}] 任务: {'; '.join(r['steps'])}")
+        lines.append(f"合并的文件: {', '.join(r['accepted']) or '无'}")
+        if r["rejected"]:
+            lines.append(f"因冲突被拒绝的改动: {', '.join(r['rejected'])}")
+        lines.append(f"说明: {r['result'][:800]}")
+    return "\n".join(lines)
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Context-size governor for long-running worker agents.
+
+qwen-code silently returns an empty stdout once its checkpoint passes ~110KB
+(see INVESTIGATION_SUMMARY.md). ContextGovernor wraps an agent, measures the
+serialized history before every run(), and once it nears the ceiling replaces the
+older turns with one summary message while keeping the recent turns verbatim.
+"""
+
+import json
+import time
+
+SUMMARY_HEADER = "[之前轮次的压缩摘要]"
+
+
+def message_text(msg) -> str:
+    """Plain text of a message in either the Qwen (parts) or simple (content) format"""
+    if 'parts' in msg:
+        texts = [p.get('text', '') for p in msg.get('parts', []) if isinstance(p, dict)]
+        return "\n".join(t for t in texts if t)
+    content = msg.get('content', '')
+    if isinstance(content, list):
+        return "\n".join(b.get('text', '') for b in content if isinstance(b, dict) and b.get('text'))
+    return str(content) if content is not None else ''
+
+
+def is_prompt_message(msg) -> bool:
+    """A user turn carrying text, not a tool/function result"""
+    if msg.get('role') != 'user':
+        return False
+    if 'parts' in msg:
+        return any(isinstance(p, dict) and 'text' in p for p in msg.get('parts', []))
+    content = msg.get('content')
+    if isinstance(content, list):
+        return not any(isinstance(b, dict) and b.get('type') == 'tool_result' for b in content)
+    return bool(content)
+
+
+def history_size(messages) -> int:
+    """Serialized size in bytes, the quantity qwen-code's limit is about"""
+    return len(json.dumps(list(messages), ensure_ascii=False).encode('utf-8'))
+
+
+def estimate_tokens(size_bytes: int) -> int:
+    """Rough token estimate (~4 bytes per token across mixed Chinese/English/JSON)"""
+    return size_bytes // 4
+
+
+def extractive_summary(messages, max_chars: int = 6000) -> str:
+    """Local summary of older turns: each prompt plus the head of the reply that followed it"""
+    lines = []
+    for msg in messages:
+        text = " ".join(message_text(msg).split())
+        if not text:
+            continue
+        if is_prompt_message(msg):
+            lines.append(f"- 指令: {text[:200]}")
+        elif msg.get('role') in ('assistant', 'model'):
+            lines.append(f"  结果: {text[:300]}")
+    summary = "\n".join(lines)
+    if len(summary) > max_chars:
+        summary = "...\n" + summary[-max_chars:]
+    return summary
+
+
+def replace_prompt_text(messages, old: str, new: str) -> bool:
+    """Swap old for new in the latest prompt containing it (in place); False if none does"""
+    for msg in reversed(messages):
+        if not is_prompt_message(msg) or old not in message_text(msg):
+            continue
+        if 'parts' in msg:
+            for part in msg['parts']:
+                if isinstance(part, dict) and 'text' in part:
+                    part['text'] = part['text'].replace(old, new)
+        elif isinstance(msg.get('content'), list):
+            for block in msg['content']:
+                if isinstance(block, dict) and block.get('text'):
+                    block['text'] = block['text'].replace(old, new)
+        else:
+            msg['content'] = msg['content'].replace(old, new)
+        return True
+    return False
+
+
+def _make_message(template, role, text):
+    if 'parts' in template:
+        return {'role': role, 'parts': [{'text': text}]}
+    return {'role': role, 'content': text}
+
+
+class ContextGovernor:
+    """Wraps an agent; compacts its history before a run() would exceed the ceiling"""
+
+    def __init__(self, agent, ceiling_bytes: int = 100_000, headroom: float = 0.8, target: float = 0.5,
+                 keep_recent_turns: int = 4, summarizer=extractive_summary):
+        self.agent = agent
+        self.ceiling_bytes = ceiling_bytes
+        self.headroom = headroom    # compact once history passes headroom * ceiling
+        self.target = target        # ... down to target * ceiling, so it doesn't re-trigger every call
+        self.keep_recent_turns = keep_recent_turns
+        self.summarizer = summarizer
+        self.stats = []          # one record per run()
+        self.compactions = 0
+
+    def __getattr__(self, name):
+        return getattr(self.agent, name)
+
+    @property
+    def messages(self):
+        return self.agent.messages
+
+    @messages.setter
+    def messages(self, value):
+        self.agent.messages = value
+
+    def compact(self, keep_recent_turns: int = None) -> bool:
+        """Fold everything before the last keep_recent_turns prompts into one summary"""
+        keep = self.keep_recent_turns if keep_recent_turns is None else keep_recent_turns
+        messages = list(self.agent.messages)
+        prompt_indices = [i for i, m in enumerate(messages) if is_prompt_message(m)]
+        if len(prompt_indices) <= keep:
+            return False
+        cut = prompt_indices[-keep] if keep > 0 else len(messages)
+        older, recent = messages[:cut], messages[cut:]
+        if not older:
+            return False
+
+        template = older[0]
+        previous = ""
+        if message_text(template).startswith(SUMMARY_HEADER):
+            # Carry an earlier summary forward instead of summarizing it again
+            previous = message_text(template)[len(SUMMARY_HEADER):].strip() + "\n"
+            older = older[2:]
+        summary = previous + self.summarizer(older)
+        ack_role = 'model' if 'parts' in template else 'assistant'
+        self.agent.messages = [
+            _make_message(template, 'user', f"{SUMMARY_HEADER}\n{summary}"),
+            _make_message(template, ack_role, "好的，我已了解之前的进展。"),
+        ] + recent
+        self.compactions += 1
+        return True
+
+    def govern(self) -> dict:
+        """Measure the history and compact it once it nears the ceiling"""
+        size = history_size(self.agent.messages)
+        record = {"bytes_before": size, "tokens_before": estimate_tokens(size), "compacted": False}
+        keep = self.keep_recent_turns
+        if size <= self.ceiling_bytes * self.headroom:
+            keep = -1
+        while size > self.ceiling_bytes * self.target and keep >= 0:
+            if self.compact(keep):
+                record["compacted"] = True
+                size = history_size(self.agent.messages)
+            keep -= 1
+        record["bytes_after"] = size
+        record["tokens_after"] = estimate_tokens(size)
+        if record["compacted"]:
+            print(f"🗜️ Compacted history: {record['bytes_before'] // 1024}KB -> {size // 1024}KB "
+                  f"(~{record['tokens_after']} tokens)")
+        if size > self.ceiling_bytes:
+            print(f"⚠️ History still {size // 1024}KB, above the {self.ceiling_bytes // 1024}KB ceiling")
+        return record
+
+    def run(self, prompt, **kwargs):
+        record = self.govern()
+        start = time.time()
+        result = self.agent.run(prompt, **kwargs)
+        record["seconds"] = round(time.time() - start, 2)
+        self.stats.append(record)
+        return result
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Local test-execution gate for the generated project.
+
+Discovers pytest files under the project, runs each one in its own process (in
+parallel), and caches the outcome under a hash of the test file plus every project
+module it imports (transitively), so only tests touching changed files re-run.
+The resulting summary is given to the reviewer, and when tests already fail the
+structured review can be skipped in favour of fixing them.
+"""
+
+import ast
+import hashlib
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from snapshots import iter_project_files
+
+
+def is_test_file(rel: Path) -> bool:
+    return rel.suffix == ".py" and (rel.name.startswith("test_") or rel.stem.endswith("_test"))
+
+
+def module_index(project_dir: Path) -> dict:
+    """Dotted module name -> file, for every .py file under the project"""
+    index = {}
+    for path, rel in iter_project_files(project_dir):
+        if rel.suffix != ".py":
+            continue
+        parts = list(rel.with_suffix("").parts)
+        if parts[-1] == "__init__":
+            parts = parts[:-1]
+        # Register every suffix so both "app.models" and "models" resolve from src layouts
+        for i in range(len(parts)):
+            index.setdefault(".".join(parts[i:]), path)
+    return index
+
+
+def imported_modules(path: Path) -> set:
+    try:
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+    except (SyntaxError, UnicodeDecodeError):
+        return set()
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            names.add(node.module)
+            names.update(f"{node.module}.{alias.name}" for alias in node.names)
+    return names
+
+
+def dependencies(test_file: Path, index: dict) -> set:
+    """Project files test_file imports, transitively"""
+    seen, stack = set(), [test_file]
+    while stack:
+        path = stack.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        for name in imported_modules(path):
+            target = index.get(name)
+            if target and target not in seen:
+                stack.append(target)
+    return seen
+
+
+class LocalTestReport:
+    def __init__(self, results: dict):
+        self.results = results  # rel path -> {"passed", "output", "cached"}
+
+    @property
+    def total(self) -> int:
+        return len(self.results)
+
+    @property
+    def failed(self) -> list:
+        """Tests that ran and failed (pytest exit code 1, or timed out)"""
+        return sorted(k for k, r in self.results.items() if not r["passed"] and not r.get("error"))
+
+    @property
+    def errors(self) -> list:
+        """Tests pytest could not run at all (collection/usage/internal errors, exit codes 2-4)"""
+        return sorted(k for k, r in self.results.items() if r.get("error"))
+
+    def summary(self, max_output: int = 1500) -> str:
+        if not self.results:
+            return "本地测试：项目中没有发现测试文件 (test_*.py / *_test.py)。"
+        passed = self.total - len(self.failed) - len(self.errors)
+        lines = [f"本地测试：{self.total} 个测试文件，{passed} 个通过，{len(self.failed)} 个失败，{len(self.errors)} 个无法运行。"]
+        for rel in self.failed:
+            lines.append(f"\n失败: {rel}\n{self.results[rel]['output'][-max_output:]}")
+        for rel in self.errors:
+            lines.append(f"\n无法运行: {rel}\n{self.results[rel]['output'][-max_output:]}")
+        return "\n".join(lines)
+
+
+class LocalTestGate:
+    """Runs the project's pytest files in parallel, re-running only those whose inputs changed"""
+
+    def __init__(self, project_dir: Path, cache_file: Path = Path(".test_cache.json"),
+                 max_workers: int = None, timeout: int = 300):
+        self.project_dir = Path(project_dir)
+        self.cache_file = Path(cache_file)
+        self.max_workers = max_workers or os.cpu_count() or 4
+        self.timeout = timeout
+        self.cache = {}
+        if self.cache_file.exists():
+            try:
+                self.cache = json.loads(self.cache_file.read_text(encoding="utf-8"))
+            except (json.JSONDecodeError, ValueError):
+                print(f"⚠️ Ignoring corrupt test cache {self.cache_file}")
+        # Without pytest every test file would "fail" and block every review
+        self.available = importlib.util.find_spec("pytest") is not None
+        if not self.available:
+            print(f"⚠️ pytest is not installed for {sys.executable}, local test gate disabled")
+
+    def _key(self, test_file: Path, index: dict) -> str:
+        h = hashlib.sha256()
+        for path in sorted(dependencies(test_file, index)):
+            h.update(str(path.relative_to(self.project_dir)).encode("utf-8") + b"\0")
+            h.update(path.read_bytes())
+        return h.hexdigest()
+
+    def _run_one(self, rel: str) -> dict:
+        try:
+            proc = subprocess.run(
+                [sys.executable, "-m", "pytest", "-q", "-x", "--no-header", rel],
+                cwd=self.project_dir, capture_output=True, text=True, timeout=self.timeout,
+            )
+        except subprocess.TimeoutExpired:
+            return {"passed": False, "returncode": None, "output": f"超时（{self.timeout}s）"}
+        output = "\n".join((proc.stdout + proc.stderr).strip().splitlines()[-40:])
+        # 0 = passed, 5 = no tests collected, 1 = tests failed;
+        # 2-4 = interrupted/internal/usage error: the gate could not judge the code
+        return {"passed": proc.returncode in (0, 5), "returncode": proc.returncode, "output": output,
+                "error": proc.returncode not in (0, 1, 5)}
+
+    def run(self) -> LocalTestReport:
+        index = module_index(self.project_dir)
+        tests = {rel.as_posix(): path for path, rel in iter_project_files(self.project_dir) if is_test_file(rel)}
+        keys = {rel: self._key(path, index) for rel, path in tests.items()}
+
+        results, to_run = {}, []
+        for rel, key in keys.items():
+            cached = self.cache.get(rel)
+            if cached and cached["key"] == key:
+                results[rel] = {**cached["result"], "cached": True}
+            else:
+                to_run.append(rel)
+
+        if to_run:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                for rel, result in zip(to_run, pool.map(self._run_one, to_run)):
+                    results[rel] = {**result, "cached": False}
+                    if result["returncode"] in (0, 1, 5):  # only real verdicts are worth reusing
+                        self.cache[rel] = {"key": keys[rel], "result": result}
+                    else:
+                        self.cache.pop(rel, None)
+
+        self.cache = {rel: entry for rel, entry in self.cache.items() if rel in tests}
+        self.cache_file.write_text(json.dumps(self.cache, ensure_ascii=False, indent=1), encoding="utf-8")
+        return LocalTestReport(results)
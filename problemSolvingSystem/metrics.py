@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Per-call latency, token and cost instrumentation for agent_loop.
+
+InstrumentedAgent wraps an agent so every run() appends one record (round, phase,
+backend, model, seconds, input/output/cache tokens, cost) to metrics.jsonl.
+Token and cost fields are filled in where raw_result exposes them.
+
+    python metrics.py debug_messages/metrics.jsonl
+"""
+
+import json
+import sys
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from router import extract_usage
+
+
+class MetricsRecorder:
+    """Appends call records to a JSONL file, tagged with the current round and phase"""
+
+    def __init__(self, metrics_file: Path, append: bool = False):
+        self.metrics_file = Path(metrics_file)
+        if not append:
+            self.metrics_file.write_text("", encoding="utf-8")
+        self.records = []
+        self._lock = threading.Lock()  # parallel fan-out helpers record concurrently
+        self.round = 0
+        self.phase = "setup"
+
+    def tag(self, round_num: int, phase: str):
+        self.round, self.phase = round_num, phase
+
+    def record(self, seconds: float, result, backend=None, model=None, phase=None, round_num=None):
+        usage = extract_usage(result.raw_result if result is not None else None)
+        record = {
+            "round": self.round if round_num is None else round_num,
+            "phase": phase or self.phase,
+            "backend": backend or "default",
+            "model": model or "default",
+            "seconds": round(seconds, 2),
+            "success": bool(result is not None and result.is_success),
+            **usage,
+        }
+        with self._lock:
+            self.records.append(record)
+            with open(self.metrics_file, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        return record
+
+
+class InstrumentedAgent:
+    """Agent wrapper that records every run() with a MetricsRecorder"""
+
+    def __init__(self, agent, recorder: MetricsRecorder):
+        self.agent = agent
+        self.recorder = recorder
+
+    def __getattr__(self, name):
+        return getattr(self.agent, name)
+
+    @property
+    def messages(self):
+        return self.agent.messages
+
+    @messages.setter
+    def messages(self, value):
+        self.agent.messages = value
+
+    def run(self, prompt, **kwargs):
+        start = time.time()
+        result = self.agent.run(prompt, **kwargs)
+        self.recorder.record(time.time() - start, result, backend=kwargs.get("cli"), model=kwargs.get("model"))
+        return result
+
+
+def summarize(records, top: int = 5) -> str:
+    """Slowest phases and calls, plus tokens per round"""
+    if not records:
+        return "No calls recorded."
+    by_phase = defaultdict(lambda: [0, 0.0])
+    by_round = defaultdict(lambda: [0, 0, 0, 0.0])
+    for r in records:
+        by_phase[r["phase"]][0] += 1
+        by_phase[r["phase"]][1] += r["seconds"]
+        totals = by_round[r["round"]]
+        totals[0] += r["input_tokens"] or 0
+        totals[1] += r["output_tokens"] or 0
+        totals[2] += r["cache_tokens"] or 0
+        totals[3] += r["cost"] or 0.0
+
+    total_seconds = sum(r["seconds"] for r in records)
+    lines = [f"{len(records)} calls, {total_seconds:.0f}s total", "", "Time by phase:"]
+    for phase, (calls, seconds) in sorted(by_phase.items(), key=lambda x: -x[1][1]):
+        lines.append(f"  {phase:<8} {calls:>4} calls  {seconds:>8.1f}s  ({seconds / (total_seconds or 1):.0%})")
+    lines += ["", f"Slowest {top} calls:"]
+    for r in sorted(records, key=lambda r: -r["seconds"])[:top]:
+        lines.append(f"  round {r['round']:>2} {r['phase']:<8} {r['model']:<16} {r['seconds']:>8.1f}s")
+    lines += ["", "Tokens per round (in / out / cache, cost):"]
+    for round_num, (tok_in, tok_out, tok_cache, cost) in sorted(by_round.items()):
+        lines.append(f"  round {round_num:>2}  {tok_in:>9} / {tok_out:>7} / {tok_cache:>9}  ${cost:.4f}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    path = Path(sys.argv[1] if len(sys.argv) > 1 else "debug_messages/metrics.jsonl")
+    records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+    print(summarize(records))
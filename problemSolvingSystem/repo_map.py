@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Incrementally maintained repo map of the generated project.
+
+Keeps a compact file tree plus top-level symbols (classes, functions, HTTP routes)
+for putYourPojectHere. Only files whose content hash changed since the last update
+are re-parsed. The rendered map is attached to build prompts so the worker does not
+spend tool calls listing directories and re-reading files to find its way around.
+
+    python repo_map.py [project_dir]
+"""
+
+import ast
+import re
+import sys
+from pathlib import Path
+
+from snapshots import scan_tree
+
+HTTP_METHODS = {"get", "post", "put", "delete", "patch", "route", "websocket"}
+
+JS_PATTERNS = [
+    re.compile(r"^\s*(?:export\s+)?(?:default\s+)?(?:async\s+)?function\s+(\w+)", re.M),
+    re.compile(r"^\s*(?:export\s+)?(?:default\s+)?class\s+(\w+)", re.M),
+    re.compile(r"^\s*export\s+(?:const|let)\s+(\w+)", re.M),
+]
+JS_ROUTE = re.compile(r"\b(?:app|router)\.(get|post|put|delete|patch)\(\s*['\"`]([^'\"`]+)", re.I)
+MD_HEADING = re.compile(r"^#{1,2}\s+(.+)$", re.M)
+
+
+def _route(decorator) -> str:
+    """'GET /path' for @app.get("/path") / @router.post(...) style decorators"""
+    if isinstance(decorator, ast.Call) and isinstance(decorator.func, ast.Attribute) \
+            and decorator.func.attr in HTTP_METHODS and decorator.args \
+            and isinstance(decorator.args[0], ast.Constant) and isinstance(decorator.args[0].value, str):
+        return f"{decorator.func.attr.upper()} {decorator.args[0].value}"
+    return ""
+
+
+def python_symbols(source: str) -> list:
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return ["(语法错误)"]
+    symbols = []
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            methods = [n.name for n in node.body if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))
+                       and not n.name.startswith("_")]
+            symbols.append(f"class {node.name}" + (f"({', '.join(methods[:6])})" if methods else ""))
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            routes = [r for r in map(_route, node.decorator_list) if r]
+            symbols.append(f"{routes[0]} -> {node.name}" if routes else f"def {node.name}")
+    return symbols
+
+
+def js_symbols(source: str) -> list:
+    symbols = [f"{m.group(1).upper()} {m.group(2)}" for m in JS_ROUTE.finditer(source)]
+    for pattern in JS_PATTERNS:
+        symbols.extend(pattern.findall(source))
+    return symbols
+
+
+def file_symbols(path: Path) -> list:
+    try:
+        source = path.read_text(encoding="utf-8")
+    except (UnicodeDecodeError, OSError):
+        return []
+    suffix = path.suffix.lower()
+    if suffix == ".py":
+        return python_symbols(source)
+    if suffix in (".js", ".jsx", ".ts", ".tsx", ".vue", ".mjs"):
+        return js_symbols(source)
+    if suffix == ".md":
+        return MD_HEADING.findall(source)[:5]
+    return []
+
+
+class RepoMap:
+    """File tree + symbol index, refreshed only for files whose hash changed"""
+
+    def __init__(self, project_dir: Path, max_chars: int = 4000):
+        self.project_dir = Path(project_dir)
+        self.max_chars = max_chars
+        self.manifest = {}
+        self.symbols = {}
+
+    def update(self) -> int:
+        """Rescan the project; returns how many files were (re)parsed"""
+        manifest = scan_tree(self.project_dir, self.manifest)
+        parsed = 0
+        for key, entry in manifest.items():
+            old = self.manifest.get(key)
+            if old is None or old["sha"] != entry["sha"] or key not in self.symbols:
+                self.symbols[key] = file_symbols(self.project_dir / key)
+                parsed += 1
+        for key in set(self.symbols) - set(manifest):
+            del self.symbols[key]
+        self.manifest = manifest
+        return parsed
+
+    def render(self) -> str:
+        if not self.manifest:
+            return f"{self.project_dir}/ 目前为空"
+        lines = [f"{self.project_dir}/"]
+        for key in sorted(self.manifest):
+            symbols = self.symbols.get(key, [])
+            line = f"  {key} ({self.manifest[key]['size']}B)"
+            if symbols:
+                line += ": " + ", ".join(symbols[:12]) + (" ..." if len(symbols) > 12 else "")
+            lines.append(line)
+        text = "\n".join(lines)
+        if len(text) > self.max_chars:
+            text = text[:self.max_chars].rsplit("\n", 1)[0] + f"\n  ...（共 {len(self.manifest)} 个文件）"
+        return text
+
+
+if __name__ == "__main__":
+    repo_map = RepoMap(Path(sys.argv[1] if len(sys.argv) > 1 else "putYourPojectHere"))
+    repo_map.update()
+    print(repo_map.render())
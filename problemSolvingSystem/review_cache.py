@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Review result cache keyed by workspace content.
+
+When the builder only "planned" and changed nothing under putYourPojectHere, the
+structured review would see exactly the same tree again. ReviewCache stores each
+ReviewResult under a hash of the project tree plus task.md (LRU-bounded, on disk),
+so the repeat review is answered locally instead of by another model call.
+"""
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+from snapshots import iter_project_files
+
+
+def tree_hash(project_dir: Path, task_file: Path = Path("task.md"), extra: str = "") -> str:
+    """Content hash over every project file (path + bytes), task.md and extra"""
+    h = hashlib.sha256()
+    h.update(extra.encode("utf-8"))
+    task_file = Path(task_file)
+    if task_file.exists():
+        h.update(b"task\0" + task_file.read_bytes())
+    for path, rel in iter_project_files(project_dir):
+        h.update(b"\0" + rel.as_posix().encode("utf-8") + b"\0")
+        h.update(hashlib.sha256(path.read_bytes()).digest())
+    return h.hexdigest()
+
+
+class CachedReview:
+    """Stands in for a RunResult when the review comes from the cache"""
+
+    def __init__(self, data: dict):
+        self.data = data
+        self.content = json.dumps(data, ensure_ascii=False)
+        self.is_success = True
+        self.raw_result = {"cached": True}
+        self.error_message = None
+
+    def has_data(self) -> bool:
+        return self.data is not None
+
+
+class ReviewCache:
+    """On-disk LRU of review data, at most max_entries entries"""
+
+    def __init__(self, cache_file: Path = Path(".review_cache.json"), max_entries: int = 100):
+        self.cache_file = Path(cache_file)
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        if self.cache_file.exists():
+            try:
+                self.entries = OrderedDict(json.loads(self.cache_file.read_text(encoding="utf-8")))
+            except (json.JSONDecodeError, ValueError):
+                print(f"⚠️ Ignoring corrupt review cache {self.cache_file}")
+
+    def _save(self):
+        tmp = self.cache_file.with_suffix(".tmp")
+        tmp.write_text(json.dumps(list(self.entries.items()), ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, self.cache_file)
+
+    def get(self, key: str):
+        """CachedReview for key, or None; a hit becomes most recently used"""
+        if key not in self.entries:
+            return None
+        self.entries.move_to_end(key)
+        self._save()
+        return CachedReview(self.entries[key])
+
+    def put(self, key: str, data: dict):
+        self.entries[key] = data
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        self._save()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Pipelined structured review for agent_loop.
+
+The review of round N runs on its own ephemeral agent in a background thread,
+against a text snapshot of the workspace taken when it was submitted, while the
+builder already works on round N+1. agent_loop collects it when it is done.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from polycli.agent import OpenSourceAgent
+
+from snapshots import iter_project_files
+
+
+def workspace_digest(project_dir: Path, max_bytes: int = 60_000) -> str:
+    """File tree plus file contents (up to max_bytes) as a single prompt section"""
+    files = list(iter_project_files(project_dir))
+    if not files:
+        return f"（{project_dir} 目前为空）"
+
+    tree = "\n".join(f"- {rel.as_posix()} ({path.stat().st_size} bytes)" for path, rel in files)
+    sections = [f"## 文件树\n{tree}"]
+    budget = max_bytes - len(tree.encode("utf-8"))
+    for path, rel in files:
+        try:
+            text = path.read_text(encoding="utf-8")
+        except (UnicodeDecodeError, OSError):
+            continue  # binary or unreadable
+        block = f"## {rel.as_posix()}\n```\n{text}\n```"
+        size = len(block.encode("utf-8"))
+        if size > budget:
+            sections.append(f"## {rel.as_posix()}\n（内容过长已省略）")
+            continue
+        sections.append(block)
+        budget -= size
+    return "\n\n".join(sections)
+
+
+class PipelinedReviewer:
+    """Runs at most one structured review at a time in the background"""
+
+    def __init__(self, schema_cls, model="glm-4.5", system_prompt="", task_file: Path = Path("task.md")):
+        self.schema_cls = schema_cls
+        self.model = model
+        self.system_prompt = system_prompt
+        self.task_file = Path(task_file)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="reviewer")
+        self._future = None
+        self._round = None
+        self.last_model = None      # model and duration of the last finished review
+        self.last_seconds = None
+
+    @property
+    def busy(self) -> bool:
+        return self._future is not None and not self._future.done()
+
+    def submit(self, round_num: int, prompt: str, project_dir: Path) -> bool:
+        """Snapshot the workspace now and review it in the background"""
+        if self._future is not None:
+            return False  # previous review not collected yet
+        task = self.task_file.read_text(encoding="utf-8") if self.task_file.exists() else ""
+        full_prompt = f"""# 需求文档 (task.md)
+{task}
+
+# 第 {round_num} 轮结束时的工作区快照 ({project_dir})
+{workspace_digest(project_dir)}
+
+{prompt}"""
+        self._round = round_num
+        self._future = self._executor.submit(self._review, full_prompt)
+        return True
+
+    def _review(self, prompt: str):
+        model, start = self.model, time.time()
+        agent = OpenSourceAgent(system_prompt=self.system_prompt)
+        result = agent.run(prompt, model=model, cli="no-tools",
+                           schema_cls=self.schema_cls, ephemeral=True)
+        self.last_model, self.last_seconds = model, time.time() - start
+        return result
+
+    def collect(self, wait: bool = False):
+        """(round_num, RunResult) of the finished review, or (None, None) if none is ready"""
+        if self._future is None or (not wait and not self._future.done()):
+            return None, None
+        future, round_num = self._future, self._round
+        self._future, self._round = None, None
+        try:
+            return round_num, future.result()
+        except Exception as e:
+            print(f"⚠️ Background review of round {round_num} failed: {e}")
+            return round_num, None
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
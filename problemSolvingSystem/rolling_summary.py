@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Rolling per-round summaries for agent_loop.
+
+Each round's results are condensed into one short record as the loop goes (locally
+by default, or by a cheap model via condense=) and appended to round_summaries.jsonl.
+The final delivery summary is then written from these records instead of from the
+whole message history, so its cost no longer grows with the number of rounds.
+
+    python rolling_summary.py debug_messages/round_summaries.jsonl
+"""
+
+import json
+import re
+import sys
+from pathlib import Path
+
+# Lines that usually carry the substance of a builder reply
+KEY_LINE = re.compile(r"^\s*(?:[-*•]|\d+[.)、]|#+|✅|❌|⚠️)|完成|实现|创建|新增|添加|修复|测试|implement|add|fix|creat", re.I)
+
+
+def condense_text(text: str, max_chars: int = 400) -> str:
+    """Extractive condensation: key lines first, then the opening lines, deduplicated"""
+    lines = []
+    for line in (text or "").splitlines():
+        line = " ".join(line.split())
+        if line and line not in lines:
+            lines.append(line)
+    ranked = [l for l in lines if KEY_LINE.search(l)] + [l for l in lines if not KEY_LINE.search(l)]
+    picked, size = set(), 0
+    for line in ranked:
+        if size + len(line) > max_chars:
+            break
+        picked.add(line)
+        size += len(line) + 1
+    condensed = "\n".join(l for l in lines if l in picked)  # keep original order
+    if not condensed and lines:
+        condensed = lines[0][:max_chars]
+    return condensed
+
+
+class RollingSummary:
+    """Collects notes during a round and persists one condensed record when it closes"""
+
+    def __init__(self, summary_file: Path, append: bool = False, max_chars: int = 400, condense=None):
+        self.summary_file = Path(summary_file)
+        self.max_chars = max_chars
+        self.condense = condense or condense_text
+        self.records = []
+        if append and self.summary_file.exists():
+            self.records = load_records(self.summary_file)
+        else:
+            self.summary_file.write_text("", encoding="utf-8")
+        self._notes = []
+
+    def add(self, phase: str, text):
+        if text and text.strip():
+            self._notes.append(f"[{phase}]\n{text.strip()}")
+
+    def close_round(self, round_num: int, changes: dict = None, review: dict = None) -> dict:
+        """Condense this round's notes into a record and append it to the summary file"""
+        record = {"round": round_num, "work": self.condense("\n".join(self._notes), self.max_chars)}
+        if changes:
+            record["files"] = {k: v[:10] for k, v in changes.items() if v}
+        if review:
+            record["completion"] = review.get("completion_percentage")
+            record["open_issues"] = (review.get("issues") or [])[:3]
+        self._notes = []
+        self.records = [r for r in self.records if r["round"] != round_num] + [record]
+        with open(self.summary_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        return record
+
+    def render(self, max_chars: int = 8000) -> str:
+        """Records as text for the final summary prompt; the oldest rounds are cut first"""
+        blocks = []
+        for r in self.records:
+            lines = [f"## 第 {r['round']} 轮"]
+            if r.get("completion") is not None:
+                lines[0] += f"（审查完成度 {r['completion']}%）"
+            for kind, paths in r.get("files", {}).items():
+                lines.append(f"{kind}: {', '.join(paths)}")
+            if r.get("work"):
+                lines.append(r["work"])
+            if r.get("open_issues"):
+                lines.append(f"遗留问题: {'; '.join(r['open_issues'])}")
+            blocks.append("\n".join(lines))
+        text = "\n\n".join(blocks)
+        if len(text) > max_chars:
+            text = "...\n" + text[-max_chars:]
+        return text
+
+
+def load_records(summary_file: Path) -> list:
+    """Records by round (a round closed twice, e.g. after a resume, keeps the later record)"""
+    by_round = {}
+    for line in Path(summary_file).read_text(encoding="utf-8").splitlines():
+        if line.strip():
+            record = json.loads(line)
+            by_round[record["round"]] = record
+    return [by_round[k] for k in sorted(by_round)]
+
+
+if __name__ == "__main__":
+    path = Path(sys.argv[1] if len(sys.argv) > 1 else "debug_messages/round_summaries.jsonl")
+    summary = RollingSummary(path, append=True)
+    print(summary.render(max_chars=10**9))
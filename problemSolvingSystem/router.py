@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Cost- and latency-aware model router for agent loops.
+
+Every routed call records latency, tokens, cost and success for its call type
+("continue", "review", "refine", "summary") and model in .model_stats.json.
+choose() then picks the cheapest candidate that meets the call type's success and
+latency targets; candidates with too few samples are tried first so the stats fill
+in. Candidates, targets and per-model prices can be overridden in router.json:
+
+    {"policy": {"summary": {"candidates": ["glm-4.5", "gpt-4o"], "min_success": 0.9}},
+     "prices": {"gpt-4o": [2.5, 10.0]}}
+
+Prices are USD per 1M input/output tokens. Candidates are listed cheapest first;
+once every candidate has an observed cost, the observed costs decide instead.
+"""
+
+import json
+import os
+from pathlib import Path
+
+DEFAULT = "default"  # the agent's own default model
+
+# Current hardcoded choices in agent_loop; add cheaper candidates in router.json
+DEFAULT_POLICY = {
+    "continue": {"candidates": [DEFAULT], "min_success": 0.8, "max_seconds": 900},
+    "refine": {"candidates": [DEFAULT], "min_success": 0.8, "max_seconds": 900},
+    "review": {"candidates": ["glm-4.5"], "min_success": 0.8, "max_seconds": 300},
+    "summary": {"candidates": ["gpt-4o"], "min_success": 0.9, "max_seconds": 300},
+}
+
+USAGE_KEYS = {
+    "input_tokens": ("input_tokens", "prompt_tokens", "promptTokenCount"),
+    "output_tokens": ("output_tokens", "completion_tokens", "candidatesTokenCount"),
+    "cache_tokens": ("cache_read_input_tokens", "cached_tokens", "cachedContentTokenCount"),
+    "cost": ("total_cost_usd", "cost_usd", "cost"),
+}
+
+
+def extract_usage(raw_result) -> dict:
+    """Token counts and cost from whatever raw_result a backend returned (missing -> None)"""
+    if isinstance(raw_result, str):
+        try:
+            raw_result = json.loads(raw_result)
+        except ValueError:
+            raw_result = None
+    usage = {name: None for name in USAGE_KEYS}
+    stack = [raw_result]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for name, keys in USAGE_KEYS.items():
+                for key in keys:
+                    if usage[name] is None and isinstance(node.get(key), (int, float)):
+                        usage[name] = node[key]
+            stack.extend(v for v in node.values() if isinstance(v, (dict, list)))
+        elif isinstance(node, list):
+            stack.extend(v for v in node if isinstance(v, (dict, list)))
+    return usage
+
+
+class ModelRouter:
+    """Chooses a model per call type from persisted per-model stats"""
+
+    def __init__(self, stats_file: Path = Path(".model_stats.json"), config_file: Path = Path("router.json"),
+                 min_samples: int = 3):
+        self.stats_file = Path(stats_file)
+        self.min_samples = min_samples
+        self.policy = {k: dict(v) for k, v in DEFAULT_POLICY.items()}
+        self.prices = {}
+        config_file = Path(config_file)
+        if config_file.exists():
+            config = json.loads(config_file.read_text(encoding="utf-8"))
+            for call_type, overrides in config.get("policy", {}).items():
+                self.policy.setdefault(call_type, {}).update(overrides)
+            self.prices = config.get("prices", {})
+        self.stats = {"models": {}, "choices": {}}
+        if self.stats_file.exists():
+            self.stats = json.loads(self.stats_file.read_text(encoding="utf-8"))
+
+    def _entry(self, call_type: str, model: str) -> dict:
+        return self.stats["models"].setdefault(call_type, {}).setdefault(model, {
+            "calls": 0, "successes": 0, "seconds": 0.0,
+            "input_tokens": 0, "output_tokens": 0, "cost": 0.0, "costed_calls": 0,
+        })
+
+    def _mean_cost(self, call_type: str, model: str):
+        e = self.stats["models"].get(call_type, {}).get(model)
+        if not e or not e["costed_calls"]:
+            return None
+        return e["cost"] / e["costed_calls"]
+
+    def _success_rate(self, call_type: str, model: str) -> float:
+        e = self.stats["models"].get(call_type, {}).get(model)
+        return e["successes"] / e["calls"] if e and e["calls"] else 0.0
+
+    def meets_targets(self, call_type: str, model: str) -> bool:
+        e = self.stats["models"].get(call_type, {}).get(model)
+        policy = self.policy[call_type]
+        return bool(e) and e["calls"] > 0 \
+            and self._success_rate(call_type, model) >= policy.get("min_success", 0.0) \
+            and e["seconds"] / e["calls"] <= policy.get("max_seconds", float("inf"))
+
+    def choose(self, call_type: str):
+        """Model name to pass to run() (None = agent default)"""
+        candidates = list(self.policy[call_type]["candidates"])
+        costs = [self._mean_cost(call_type, m) for m in candidates]
+        if all(c is not None for c in costs):
+            candidates = [m for _, m in sorted(zip(costs, candidates), key=lambda x: x[0])]
+
+        chosen = None
+        for model in candidates:
+            e = self.stats["models"].get(call_type, {}).get(model)
+            if e is None or e["calls"] < self.min_samples or self.meets_targets(call_type, model):
+                chosen = model
+                break
+        if chosen is None:
+            # Nothing meets the targets: fall back to the most reliable candidate
+            chosen = max(candidates, key=lambda m: self._success_rate(call_type, m))
+
+        choices = self.stats["choices"].setdefault(call_type, {})
+        choices[chosen] = choices.get(chosen, 0) + 1
+        return None if chosen == DEFAULT else chosen
+
+    def record(self, call_type: str, model, seconds: float, result, success: bool = None):
+        """Add one observed call; success defaults to 'succeeded with non-empty content'"""
+        model = model or DEFAULT
+        if success is None:
+            success = bool(result is not None and result.is_success and (result.content or "").strip())
+        usage = extract_usage(result.raw_result if result is not None else None)
+        e = self._entry(call_type, model)
+        e["calls"] += 1
+        e["successes"] += int(success)
+        e["seconds"] += seconds
+        e["input_tokens"] += usage["input_tokens"] or 0
+        e["output_tokens"] += usage["output_tokens"] or 0
+        cost = usage["cost"]
+        if cost is None and model in self.prices and usage["input_tokens"] is not None:
+            price_in, price_out = self.prices[model]
+            cost = (usage["input_tokens"] * price_in + (usage["output_tokens"] or 0) * price_out) / 1_000_000
+        if cost is not None:
+            e["cost"] += cost
+            e["costed_calls"] += 1
+        self.save()
+
+    def save(self):
+        tmp = self.stats_file.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.stats, indent=2, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, self.stats_file)
+
+    def report(self) -> str:
+        lines = []
+        for call_type, models in self.stats["models"].items():
+            for model, e in models.items():
+                mean_cost = f"${e['cost'] / e['costed_calls']:.4f}" if e["costed_calls"] else "n/a"
+                lines.append(f"{call_type:<8} {model:<24} {e['calls']:>4} calls  "
+                             f"{e['successes'] / e['calls']:.0%} ok  {e['seconds'] / e['calls']:.1f}s  {mean_cost}/call")
+        return "\n".join(lines)
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Content-addressed per-round snapshots of the generated project.
+
+Each file is stored once under objects/<sha256>, so a round that changed two files
+costs two objects plus a small manifest. Files whose size and mtime match the
+previous manifest are not re-read. Objects are copies, not hardlinks into the
+workspace, because the builder edits files in place and would corrupt the store.
+
+    python snapshots.py list
+    python snapshots.py diff 3 5
+    python snapshots.py restore 4
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+SKIP_DIRS = {".git", "node_modules", "__pycache__", ".venv", "venv", "dist", "build", ".pytest_cache"}
+
+
+def iter_project_files(project_dir: Path):
+    """Project files in a stable order, skipping VCS/dependency/cache dirs"""
+    project_dir = Path(project_dir)
+    if not project_dir.exists():
+        return
+    for path in sorted(project_dir.rglob("*")):
+        rel = path.relative_to(project_dir)
+        if any(part in SKIP_DIRS or part.startswith(".") for part in rel.parts[:-1]):
+            continue
+        if path.is_file():
+            yield path, rel
+
+
+def file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def scan_tree(project_dir: Path, previous: dict = None) -> dict:
+    """{relative path: {sha, size, mtime_ns}}; entries whose size+mtime match previous keep its hash"""
+    previous = previous or {}
+    manifest = {}
+    for path, rel in iter_project_files(project_dir):
+        st = path.stat()
+        key = rel.as_posix()
+        old = previous.get(key)
+        if old and old["size"] == st.st_size and old["mtime_ns"] == st.st_mtime_ns:
+            sha = old["sha"]
+        else:
+            sha = file_sha256(path)
+        manifest[key] = {"sha": sha, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+    return manifest
+
+
+def compare_manifests(old: dict, new: dict) -> dict:
+    """added / removed / modified paths between two manifests"""
+    return {
+        "added": sorted(k for k in new if k not in old),
+        "removed": sorted(k for k in old if k not in new),
+        "modified": sorted(k for k in new if k in old and new[k]["sha"] != old[k]["sha"]),
+    }
+
+
+class SnapshotStore:
+    """objects/ holds unique file contents, manifests/round_XX.json maps paths to them"""
+
+    def __init__(self, project_dir: Path = Path("putYourPojectHere"), root: Path = Path(".snapshots")):
+        self.project_dir = Path(project_dir)
+        self.root = Path(root)
+        self.objects = self.root / "objects"
+        self.manifests = self.root / "manifests"
+        self.objects.mkdir(parents=True, exist_ok=True)
+        self.manifests.mkdir(parents=True, exist_ok=True)
+        self._last = {}  # most recent manifest, used as a stat cache
+
+    def _object_path(self, sha: str) -> Path:
+        return self.objects / sha[:2] / sha
+
+    def read_object(self, sha: str):
+        """Stored bytes for sha, or None if this content was never snapshotted"""
+        path = self._object_path(sha)
+        return path.read_bytes() if path.exists() else None
+
+    def _manifest_path(self, round_num: int) -> Path:
+        return self.manifests / f"round_{round_num:02d}.json"
+
+    def rounds(self) -> list:
+        return sorted(int(p.stem.split("_")[1]) for p in self.manifests.glob("round_*.json"))
+
+    def manifest(self, round_num: int) -> dict:
+        path = self._manifest_path(round_num)
+        if not path.exists():
+            raise KeyError(f"No snapshot for round {round_num}")
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def scan(self, previous: dict = None) -> dict:
+        """Manifest of the workspace now; files unchanged by size+mtime reuse previous hashes"""
+        return scan_tree(self.project_dir, self._last if previous is None else previous)
+
+    def snapshot(self, round_num: int) -> dict:
+        """Store the current tree as round_num; returns {'files', 'new_objects', 'new_bytes'}"""
+        manifest = self.scan()
+        new_objects = new_bytes = 0
+        for key, entry in manifest.items():
+            obj = self._object_path(entry["sha"])
+            if obj.exists():
+                continue
+            obj.parent.mkdir(exist_ok=True)
+            tmp = obj.with_suffix(".tmp")
+            shutil.copyfile(self.project_dir / key, tmp)
+            os.replace(tmp, obj)
+            new_objects += 1
+            new_bytes += entry["size"]
+        self._manifest_path(round_num).write_text(json.dumps(manifest, indent=1), encoding="utf-8")
+        self._last = manifest
+        return {"files": len(manifest), "new_objects": new_objects, "new_bytes": new_bytes}
+
+    def diff(self, round_a: int, round_b: int) -> dict:
+        return compare_manifests(self.manifest(round_a), self.manifest(round_b))
+
+    def restore(self, round_num: int) -> dict:
+        """Make the workspace match round_num, touching only files that differ"""
+        target = self.manifest(round_num)
+        current = self.scan()
+        changes = compare_manifests(current, target)
+        for key in changes["removed"]:
+            (self.project_dir / key).unlink()
+            del current[key]
+        for key in changes["added"] + changes["modified"]:
+            dest = self.project_dir / key
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(self._object_path(target[key]["sha"]), dest)
+            st = dest.stat()
+            current[key] = {"sha": target[key]["sha"], "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+        self._last = current
+        return changes
+
+
+if __name__ == "__main__":
+    store = SnapshotStore()
+    command = sys.argv[1] if len(sys.argv) > 1 else "list"
+    if command == "list":
+        for r in store.rounds():
+            m = store.manifest(r)
+            print(f"round {r:02d}: {len(m)} files, {sum(e['size'] for e in m.values())} bytes")
+    elif command == "diff" and len(sys.argv) == 4:
+        print(json.dumps(store.diff(int(sys.argv[2]), int(sys.argv[3])), indent=2))
+    elif command == "restore" and len(sys.argv) == 3:
+        changes = store.restore(int(sys.argv[2]))
+        print(f"Restored round {sys.argv[2]}: " + ", ".join(f"{len(v)} {k}" for k, v in changes.items()))
+    else:
+        print("Usage: python snapshots.py [list | diff A B | restore N]")
+        sys.exit(1)
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""Checks for fan-out step grouping on the reviewer's (Chinese) next_steps"""
+
+from fanout import group_steps, mentioned_files
+
+KNOWN_FILES = {"app.py", "src/auth/login.py", "templates/index.html"}
+
+
+def test_paths_inside_chinese_text():
+    assert mentioned_files("修复app.py中的登录", KNOWN_FILES) == {"app.py"}
+    assert mentioned_files("在src/auth/login.py里加上密码校验", KNOWN_FILES) == {"src/auth/login.py"}
+    assert mentioned_files("优化login.py的错误提示", KNOWN_FILES) == {"src/auth/login.py"}
+    assert mentioned_files("完善文档", KNOWN_FILES) == set()
+
+
+def test_steps_on_the_same_file_share_a_group():
+    steps = ["修复app.py中的登录", "给templates/index.html加上表单", "app.py里补充日志"]
+    groups = group_steps(steps, KNOWN_FILES, max_workers=3)
+    assert len(groups) == 2
+    (first, first_files), (second, second_files) = groups
+    assert first == [steps[0], steps[2]] and first_files == {"app.py"}
+    assert second == [steps[1]] and second_files == {"templates/index.html"}
+
+
+if __name__ == "__main__":
+    test_paths_inside_chinese_text()
+    test_steps_on_the_same_file_share_a_group()
+    print("fan-out checks passed")
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Append-only transcript log for agent_loop debug output.
+
+Instead of dumping the full (growing) message history every checkpoint, only the
+messages added since the last checkpoint are appended to transcript.jsonl.
+transcript_index.jsonl records, per checkpoint, which byte range of the log makes
+up the history at that moment, so any snapshot can be rebuilt on demand:
+
+    python transcript.py debug_messages round_03_after > round_03_after.json
+"""
+
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+
+def _serialize(messages) -> bytes:
+    return "".join(json.dumps(m, ensure_ascii=False) + "\n" for m in messages).encode("utf-8")
+
+
+class TranscriptLog:
+    """Writes worker.messages checkpoints as deltas; log writes are linear in total messages"""
+
+    def __init__(self, debug_dir: Path, append: bool = False):
+        self.debug_dir = Path(debug_dir)
+        self.debug_dir.mkdir(exist_ok=True)
+        self.log_file = self.debug_dir / "transcript.jsonl"
+        self.index_file = self.debug_dir / "transcript_index.jsonl"
+        if not append or not self.log_file.exists():
+            self.log_file.write_text("", encoding="utf-8")
+            self.index_file.write_text("", encoding="utf-8")
+        # A resumed run continues the log; its first checkpoint starts a new segment
+        self._end = self.log_file.stat().st_size   # byte offset of the end of the log
+        self._segment_start = self._end              # byte offset where the current history begins
+        self._logged = 0                  # messages of the current history already in the log
+        self._prefix = hashlib.sha1()     # rolling hash of exactly those logged bytes
+
+    def _diverged(self, messages) -> bool:
+        """History was rewritten (rollback / compaction) instead of appended to.
+        The whole logged prefix is compared, not just its last message, so a rewrite
+        that keeps the length and the tail still starts a new segment."""
+        if len(messages) < self._logged:
+            return True
+        if self._logged == 0:
+            return False
+        return hashlib.sha1(_serialize(messages[:self._logged])).digest() != self._prefix.digest()
+
+    def checkpoint(self, label: str, messages) -> int:
+        """Append new messages and index the snapshot under label. Returns messages written."""
+        messages = list(messages)
+        if self._diverged(messages):
+            # Start a new segment holding the rewritten history
+            self._segment_start = self._end
+            self._logged = 0
+            self._prefix = hashlib.sha1()
+
+        new_messages = messages[self._logged:]
+        if new_messages:
+            data = _serialize(new_messages)
+            with open(self.log_file, "ab") as f:
+                f.write(data)
+            self._end += len(data)
+            self._logged = len(messages)
+            self._prefix.update(data)
+
+        entry = {"label": label, "start": self._segment_start, "end": self._end, "count": len(messages)}
+        with open(self.index_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        return len(new_messages)
+
+
+def load_index(debug_dir: Path) -> dict:
+    """label -> index entry (later entries win if a label repeats)"""
+    index = {}
+    index_file = Path(debug_dir) / "transcript_index.jsonl"
+    if index_file.exists():
+        for line in index_file.read_text(encoding="utf-8").splitlines():
+            if line.strip():
+                entry = json.loads(line)
+                index[entry["label"]] = entry
+    return index
+
+
+def rebuild_snapshot(debug_dir: Path, label: str) -> list:
+    """Rebuild the message list as it was at checkpoint label"""
+    entry = load_index(debug_dir).get(label)
+    if entry is None:
+        raise KeyError(f"No checkpoint named {label!r} in {debug_dir}")
+    with open(Path(debug_dir) / "transcript.jsonl", "rb") as f:
+        f.seek(entry["start"])
+        data = f.read(entry["end"] - entry["start"])
+    return [json.loads(line) for line in data.decode("utf-8").splitlines() if line.strip()]
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python transcript.py <debug_dir> [label]")
+        sys.exit(1)
+    debug_dir = Path(sys.argv[1])
+    if len(sys.argv) < 3:
+        for label, entry in load_index(debug_dir).items():
+            print(f"{label}: {entry['count']} messages")
+    else:
+        json.dump(rebuild_snapshot(debug_dir, sys.argv[2]), sys.stdout, indent=2, ensure_ascii=False)
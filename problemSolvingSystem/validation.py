@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Silent-failure detection for worker runs.
+
+A backend can exit 0 with an empty body; PolyCLI then hands back the previous
+message as the "result" (see INVESTIGATION_SUMMARY.md). run_validated() checks each
+result, rolls worker.messages back to the pre-run snapshot on a hit, and retries
+first with a compacted context and then on a fallback CLI. Every retry is recorded.
+"""
+
+import copy
+import json
+import time
+from pathlib import Path
+
+
+def check_result(result, previous_content=None):
+    """Return why result is a silent failure, or None if it looks real"""
+    if result is None:
+        return "no result"
+    if not result.is_success:
+        return f"error: {result.error_message}"
+    content = result.content
+    if content is None or content == "":
+        return "empty"
+    if not content.strip():
+        return "whitespace-only"
+    if previous_content is not None and content == previous_content:
+        return "identical to previous"
+    return None
+
+
+class RetryLog:
+    """Append-only record of retried runs"""
+
+    def __init__(self, log_file: Path):
+        self.log_file = Path(log_file)
+        self.records = []
+
+    def record(self, **fields):
+        fields["time"] = time.strftime("%Y-%m-%d %H:%M:%S")
+        self.records.append(fields)
+        with open(self.log_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(fields, ensure_ascii=False) + "\n")
+
+
+def run_validated(worker, prompt, previous_content=None, retry_log=None, label="",
+                  fallback_cli="mini-swe", **kwargs):
+    """worker.run() that rolls back and retries when the result is a silent failure"""
+    snapshot = copy.deepcopy(list(worker.messages))
+    attempts = [("original", {})]
+    if hasattr(worker, "compact"):
+        attempts.append(("compacted", {}))
+    if fallback_cli and kwargs.get("cli") != fallback_cli:
+        attempts.append((f"cli={fallback_cli}", {"cli": fallback_cli}))
+
+    result = None
+    for attempt, (action, overrides) in enumerate(attempts):
+        if attempt > 0:
+            worker.messages = copy.deepcopy(snapshot)
+            if action == "compacted" and not worker.compact(keep_recent_turns=1):
+                continue
+            print(f"♻️ Retrying {label} ({action})")
+        try:
+            result = worker.run(prompt, **{**kwargs, **overrides})
+            reason = check_result(result, previous_content)
+        except Exception as e:
+            # A backend that raises is just another failed attempt, not the end of the loop
+            result, reason = None, f"raised {type(e).__name__}: {e}"
+        if reason is None:
+            return result
+        print(f"⚠️ Silent failure in {label}: {reason}")
+        if retry_log:
+            retry_log.record(label=label, attempt=attempt, action=action, reason=reason,
+                             history_messages=len(snapshot))
+
+    # Every attempt failed: leave the history as it was before this run
+    worker.messages = copy.deepcopy(snapshot)
+    return result
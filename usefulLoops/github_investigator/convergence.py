@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Convergence detector for investigation rounds.
+
+After the critic's cut, each round is scored by its information gain:
+  - novelty: share of the document's word 5-gram shingles never seen in an earlier round
+  - churn:   share of lines changed since the previous round (difflib)
+A round is low-gain when both are under their thresholds; after `patience` low-gain
+rounds in a row the document has converged and further writer rounds add nothing.
+"""
+
+import difflib
+import re
+import zlib
+
+WORD = re.compile(r"\w+", re.U)
+
+
+def shingles(text: str, k: int = 5) -> set:
+    """Hashed word k-grams (stable across runs)"""
+    words = WORD.findall(text.lower())
+    if len(words) < k:
+        return {zlib.crc32(" ".join(words).encode("utf-8"))} if words else set()
+    return {zlib.crc32(" ".join(words[i:i + k]).encode("utf-8")) for i in range(len(words) - k + 1)}
+
+
+class ConvergenceDetector:
+    """Tracks per-round information gain and says when to stop"""
+
+    def __init__(self, novelty_threshold: float = 0.05, churn_threshold: float = 0.1,
+                 patience: int = 2, k: int = 5):
+        self.novelty_threshold = novelty_threshold
+        self.churn_threshold = churn_threshold
+        self.patience = patience
+        self.k = k
+        self.seen = set()      # every shingle that survived a critic cut so far
+        self.previous = None   # document lines after the previous round
+        self.history = []      # one {"novelty", "churn", "low_gain"} per round
+
+    def update(self, text: str) -> dict:
+        """Score the document as it stands after this round's critic pass"""
+        current = shingles(text, self.k)
+        novelty = len(current - self.seen) / len(current) if current else 0.0
+        lines = text.splitlines()
+        if self.previous is None:
+            churn = 1.0
+        else:
+            churn = 1.0 - difflib.SequenceMatcher(None, self.previous, lines, autojunk=False).ratio()
+        self.seen |= current
+        self.previous = lines
+        entry = {
+            "novelty": round(novelty, 3),
+            "churn": round(churn, 3),
+            "low_gain": novelty < self.novelty_threshold and churn < self.churn_threshold,
+        }
+        self.history.append(entry)
+        return entry
+
+    @property
+    def converged(self) -> bool:
+        recent = self.history[-self.patience:]
+        return len(recent) == self.patience and all(e["low_gain"] for e in recent)
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Compression-based information-density scoring for project-prompt.md.
+
+A line's density is how many compressed bytes it costs per raw byte once zlib has
+already seen a corpus of generic README prose plus everything above it in the
+document. Boilerplate and restatements compress almost for free; specific numbers,
+names and trade-offs do not. Lines far below the threshold are pruned before the
+critic runs, borderline ones are flagged for it, so the critic reads less and cuts less.
+
+    python density.py project-prompt.md      # lines sorted by density
+"""
+
+import re
+import sys
+import zlib
+from pathlib import Path
+
+# Generic README/marketing prose: what "could describe 100 other projects" looks like
+GENERIC_CORPUS = """
+This project is a simple, fast, lightweight and easy to use library. It provides a clean and
+intuitive API that makes it easy to get started. The library is well documented and actively
+maintained, with a growing community of contributors. It is designed to be modular, extensible
+and flexible, so you can customize it to fit your needs. It supports multiple platforms and
+integrates seamlessly with popular frameworks and tools.
+
+Features: high performance, scalable architecture, comprehensive documentation, easy
+installation, simple configuration, extensive test coverage, robust error handling, type hints,
+async support, plugin system, command line interface, cross-platform support, open source.
+
+Installation: install the package with pip install or npm install, then import it in your code.
+Quick start: create a client, configure your API key, and call the main function. See the
+examples directory and the documentation for more details and advanced usage.
+
+The codebase follows best practices and a clear separation of concerns. The architecture is
+modular, with a core module, utilities, and tests. Dependencies are managed with standard tools.
+It uses modern language features such as async/await, dataclasses and type annotations.
+Error handling is done with exceptions and clear error messages. Logging is configurable.
+
+Users appreciate the simplicity and the good documentation, but some find the learning curve
+steep for advanced features. Compared to alternatives it offers more flexibility and control,
+while alternatives may be simpler for basic use cases. Some features users might expect are
+missing, and the project could benefit from better examples and more documentation.
+
+Contributing: pull requests are welcome. Please open an issue first to discuss what you would
+like to change. Make sure to update tests as appropriate. License: MIT.
+"""
+
+MIN_CHARS = 30          # shorter lines are too small to score reliably
+PROTECTED = re.compile(r"^\s*(#|```|~~~|\||$)")   # headings, code fences, tables, blank lines
+FENCE = re.compile(r"^\s*(```|~~~)")
+
+
+def line_densities(text: str, corpus: str = GENERIC_CORPUS) -> list:
+    """(line_index, density) for every scoreable line; density = compressed/raw bytes given context.
+    Lines inside fenced code blocks are never scored: dropping one would break the snippet."""
+    base = zlib.compressobj(9)
+    base.compress(corpus.encode("utf-8"))
+    base.flush(zlib.Z_SYNC_FLUSH)
+    scores = []
+    fence = None   # opening marker of the code block we are in, if any
+    for i, line in enumerate(text.splitlines()):
+        data = (line + "\n").encode("utf-8")
+        marker = FENCE.match(line)
+        if marker and fence is None:
+            fence = marker.group(1)
+        elif marker and marker.group(1) == fence:
+            fence = None
+        elif fence is None and len(line.strip()) >= MIN_CHARS and not PROTECTED.match(line):
+            probe = base.copy()
+            cost = len(probe.compress(data) + probe.flush(zlib.Z_SYNC_FLUSH))
+            scores.append((i, cost / len(data)))
+        base.compress(data)
+        base.flush(zlib.Z_SYNC_FLUSH)
+    return scores
+
+
+def section_densities(text: str, corpus: str = GENERIC_CORPUS) -> dict:
+    """'## Section' title -> mean density of its scored lines"""
+    lines = text.splitlines()
+    section_of, title = {}, "(preamble)"
+    for i, line in enumerate(lines):
+        if line.startswith("## "):
+            title = line[3:].strip()
+        section_of[i] = title
+    totals = {}
+    for i, density in line_densities(text, corpus):
+        total = totals.setdefault(section_of[i], [0.0, 0])
+        total[0] += density
+        total[1] += 1
+    return {t: s / n for t, (s, n) in totals.items()}
+
+
+def prefilter(text: str, prune_below: float = 0.25, flag_below: float = 0.5, corpus: str = GENERIC_CORPUS):
+    """(pruned_text, pruned_lines, flagged_lines). Lines with digits are flagged, never pruned."""
+    lines = text.splitlines()
+    drop, flagged = set(), []
+    for i, density in line_densities(text, corpus):
+        if density < prune_below and not re.search(r"\d", lines[i]):
+            drop.add(i)
+        elif density < flag_below:
+            flagged.append(lines[i].strip())
+    pruned = [lines[i].strip() for i in sorted(drop)]
+    kept = [line for i, line in enumerate(lines) if i not in drop]
+    return "\n".join(kept) + ("\n" if text.endswith("\n") else ""), pruned, flagged
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python density.py <document.md>")
+        sys.exit(1)
+    text = Path(sys.argv[1]).read_text(encoding="utf-8")
+    lines = text.splitlines()
+    for i, density in sorted(line_densities(text), key=lambda x: x[1]):
+        print(f"{density:.2f}  {lines[i][:100]}")
+    print()
+    for title, density in section_densities(text).items():
+        print(f"{density:.2f}  ## {title}")
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Section-locked document store for parallel writers.
+
+Each "## Section" of a Markdown document is its own unit. A writer leases a section
+and gets a private draft file holding just that section; on commit the draft is
+appended to the section's log and merged into the document under a lock, replacing
+only that section, then atomically renamed into place. Two writers working on
+different sections at the same time can no longer overwrite each other's edits.
+
+    python doc_store.py project-prompt.md     # list sections and their commit counts
+"""
+
+import json
+import os
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+HEADING = re.compile(r"^## +(.+?)\s*$", re.M)
+
+
+def parse_sections(text: str):
+    """(preamble, OrderedDict title -> body) for the '## ' sections of a document"""
+    matches = list(HEADING.finditer(text))
+    preamble = text[:matches[0].start()] if matches else text
+    sections = OrderedDict()
+    for i, m in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+        body = text[m.end():end].strip("\n")
+        title = m.group(1)
+        sections[title] = f"{sections[title]}\n\n{body}" if title in sections else body
+    return preamble, sections
+
+
+def render_sections(preamble: str, sections) -> str:
+    parts = [preamble.rstrip("\n") + "\n\n"] if preamble.strip() else []
+    parts += [f"## {title}\n\n{body.strip()}\n\n" for title, body in sections.items()]
+    return "".join(parts).rstrip("\n") + "\n"
+
+
+def slugify(title: str) -> str:
+    return re.sub(r"[^\w-]+", "_", title.strip().lower()).strip("_") or "section"
+
+
+def merge_lines(base: str, ours: str, theirs: str) -> str:
+    """Line-level three-way merge: theirs, minus lines ours deleted from base, plus lines ours added"""
+    if ours.strip() == base.strip():
+        return theirs
+    base_lines, our_lines = set(base.splitlines()), set(ours.splitlines())
+    deleted = {l for l in base_lines - our_lines if l.strip()}
+    merged = [l for l in theirs.splitlines() if l not in deleted]
+    present = set(merged)
+    merged += [l for l in ours.splitlines() if l not in base_lines and l not in present and l.strip()]
+    return "\n".join(merged).strip()
+
+
+class SectionLeaseError(RuntimeError):
+    pass
+
+
+class SectionStore:
+    """Per-section leases, drafts and append-only logs over one Markdown file"""
+
+    def __init__(self, doc_file: Path):
+        self.doc_file = Path(doc_file)
+        self.work_dir = self.doc_file.parent / f".{self.doc_file.stem}.sections"
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        self._doc_lock = threading.Lock()     # serializes read-merge-replace of the document
+        self._leases = {}                     # section title -> owner
+        self._seeds = {}                      # section title -> body the lease's draft was seeded from
+        self._leases_lock = threading.Lock()
+
+    def draft_path(self, section: str) -> Path:
+        return self.work_dir / f"{slugify(section)}.md"
+
+    def log_path(self, section: str) -> Path:
+        return self.work_dir / f"{slugify(section)}.log.jsonl"
+
+    def read(self):
+        text = self.doc_file.read_text(encoding="utf-8") if self.doc_file.exists() else ""
+        return parse_sections(text)
+
+    def lease(self, section: str, owner: str) -> Path:
+        """Take the section for owner; returns its draft, seeded with the current section text"""
+        with self._leases_lock:
+            holder = self._leases.get(section)
+            if holder not in (None, owner):
+                raise SectionLeaseError(f"Section {section!r} is leased by {holder}")
+            self._leases[section] = owner
+        with self._doc_lock:
+            _, sections = self.read()
+        seed = sections.get(section, "").strip()
+        self._seeds[section] = seed
+        draft = self.draft_path(section)
+        draft.write_text(f"## {section}\n\n{seed}".rstrip("\n") + "\n", encoding="utf-8")
+        return draft
+
+    def release(self, section: str, owner: str):
+        with self._leases_lock:
+            if self._leases.get(section) == owner:
+                del self._leases[section]
+                self._seeds.pop(section, None)
+
+    def commit(self, section: str, owner: str) -> bool:
+        """Merge owner's draft into the document and release the lease. Returns True if it changed."""
+        with self._leases_lock:
+            if self._leases.get(section) != owner:
+                raise SectionLeaseError(f"{owner} does not hold section {section!r}")
+        try:
+            draft = self.draft_path(section).read_text(encoding="utf-8") if self.draft_path(section).exists() else ""
+            body = self._draft_body(section, draft)
+            with open(self.log_path(section), "a", encoding="utf-8") as f:
+                f.write(json.dumps({"time": time.time(), "owner": owner, "body": body}, ensure_ascii=False) + "\n")
+            with self._doc_lock:
+                preamble, sections = self.read()
+                current = sections.get(section, "").strip()
+                seed = self._seeds.get(section, "")
+                if current != seed:
+                    # The section changed in the document itself since the lease (e.g. an agent
+                    # wrote there directly): keep those edits and merge the draft's changes in
+                    print(f"⚠️ Section {section!r} changed outside {owner}'s draft, merging")
+                    body = merge_lines(seed, body, current)
+                if current == body:
+                    return False
+                sections[section] = body
+                tmp = self.doc_file.with_suffix(".tmp")
+                tmp.write_text(render_sections(preamble, sections), encoding="utf-8")
+                os.replace(tmp, self.doc_file)
+            return True
+        finally:
+            self.release(section, owner)
+
+    @staticmethod
+    def _draft_body(section: str, draft: str) -> str:
+        """Section body from a draft: drop its own heading, demote any other '## ' headings"""
+        _, sections = parse_sections(draft)
+        preamble = HEADING.split(draft, maxsplit=1)[0].strip() if sections else draft.strip()
+        parts = [preamble] if preamble else []
+        for title, body in sections.items():
+            parts.append(body if title == section else f"### {title}\n\n{body}")
+        return "\n\n".join(p for p in parts if p.strip())
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python doc_store.py <document.md>")
+        sys.exit(1)
+    store = SectionStore(Path(sys.argv[1]))
+    _, sections = store.read()
+    for title, body in sections.items():
+        log = store.log_path(title)
+        commits = len(log.read_text(encoding="utf-8").splitlines()) if log.exists() else 0
+        print(f"## {title}: {len(body)} chars, {commits} commits")
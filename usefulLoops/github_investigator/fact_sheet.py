@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Local static pre-analysis of a checked-out repository.
+
+Builds a compact fact sheet (LOC per module, largest files, import-graph hubs,
+dependency manifests, test layout, async/threading primitives) so writers can start
+on the code that matters instead of spending their first turns on orientation.
+Sheets are cached in .fact_sheets/ by commit SHA.
+
+    python fact_sheet.py path/to/checkout
+"""
+
+import ast
+import json
+import re
+import subprocess
+import sys
+from collections import Counter, defaultdict
+from pathlib import Path
+
+CACHE_DIR = Path(__file__).parent / ".fact_sheets"
+
+SKIP_DIRS = {".git", "node_modules", "vendor", "dist", "build", "target", "__pycache__",
+             ".venv", "venv", ".tox", ".mypy_cache", ".pytest_cache", "site-packages"}
+CODE_SUFFIXES = {".py", ".js", ".jsx", ".ts", ".tsx", ".mjs", ".go", ".rs", ".java", ".kt",
+                 ".rb", ".c", ".h", ".cc", ".cpp", ".hpp", ".cs", ".swift", ".php", ".scala"}
+MANIFESTS = ["pyproject.toml", "setup.py", "setup.cfg", "requirements.txt", "Pipfile", "package.json",
+             "go.mod", "Cargo.toml", "Gemfile", "pom.xml", "build.gradle", "composer.json"]
+
+CONCURRENCY = {
+    "asyncio": re.compile(r"\basyncio\.\w+|\basync\s+def\b"),
+    "threading": re.compile(r"\bthreading\.\w+|\bThread\("),
+    "multiprocessing": re.compile(r"\bmultiprocessing\.\w+|\bProcessPoolExecutor\b"),
+    "executors": re.compile(r"\bThreadPoolExecutor\b|\bconcurrent\.futures\b"),
+    "locks": re.compile(r"\b(?:R?Lock|Semaphore|Mutex|RwLock|sync\.Mutex)\b"),
+    "goroutines/tasks": re.compile(r"\bgo\s+func\b|\btokio::spawn\b|\bPromise\.all\b|\bnew Worker\("),
+}
+JS_IMPORT = re.compile(r"""(?:import\s[^'"]*from\s*|require\(\s*|import\(\s*)['"](\.[^'"]+)['"]""")
+
+
+def iter_code_files(repo_dir: Path):
+    for path in sorted(repo_dir.rglob("*")):
+        if path.is_file() and path.suffix in CODE_SUFFIXES \
+                and not any(part in SKIP_DIRS for part in path.relative_to(repo_dir).parts[:-1]):
+            yield path
+
+
+def commit_sha(repo_dir: Path) -> str:
+    result = subprocess.run(["git", "rev-parse", "HEAD"], cwd=repo_dir, capture_output=True, text=True)
+    return result.stdout.strip() if result.returncode == 0 else ""
+
+
+def _python_imports(source: str, rel: Path, modules: dict) -> set:
+    """Local modules (as repo-relative paths) imported by a Python file"""
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return set()
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base = rel.parent.parts[:len(rel.parent.parts) - node.level + 1]
+                names.add(".".join(base + ((node.module,) if node.module else ())))
+            elif node.module:
+                names.add(node.module)
+    # Script-style sibling imports resolve relative to the importing file's directory
+    names |= {".".join(rel.parent.parts + (name,)) for name in names if rel.parent.parts}
+    found = set()
+    for name in names:
+        while name:
+            if name in modules:
+                found.add(modules[name])
+                break
+            name = name.rpartition(".")[0]
+    return found
+
+
+def _js_imports(source: str, rel: Path, files: set) -> set:
+    found = set()
+    for spec in JS_IMPORT.findall(source):
+        target = (rel.parent / spec).as_posix()
+        parts = []
+        for part in target.split("/"):
+            if part == "..":
+                parts = parts[:-1]
+            elif part != ".":
+                parts.append(part)
+        target = "/".join(parts)
+        for candidate in (target, *(target + s for s in (".js", ".ts", ".tsx", ".jsx", "/index.js", "/index.ts"))):
+            if candidate in files:
+                found.add(candidate)
+                break
+    return found
+
+
+def _dependencies(repo_dir: Path) -> list:
+    lines = []
+    for name in MANIFESTS:
+        path = repo_dir / name
+        if not path.exists():
+            continue
+        text = path.read_text(encoding="utf-8", errors="replace")
+        deps = []
+        if name == "package.json":
+            try:
+                data = json.loads(text)
+                deps = list(data.get("dependencies", {})) + [f"{d} (dev)" for d in data.get("devDependencies", {})]
+            except ValueError:
+                pass
+        elif name == "requirements.txt":
+            deps = [l.strip() for l in text.splitlines() if l.strip() and not l.startswith(("#", "-"))]
+        elif name in ("pyproject.toml", "Cargo.toml"):
+            block = re.search(r"^(?:dependencies\s*=\s*\[(.*?)\]|\[dependencies\](.*?)(?=^\[))", text, re.S | re.M)
+            if block:
+                body = block.group(1) or block.group(2) or ""
+                deps = re.findall(r"""^\s*["']?([A-Za-z0-9_.\-]+)""", body, re.M)
+        elif name == "go.mod":
+            deps = re.findall(r"^\s+([\w./-]+)\s+v", text, re.M)
+        lines.append(f"{name}: " + (", ".join(deps[:15]) + (" ..." if len(deps) > 15 else "") if deps else "present"))
+    return lines
+
+
+def analyze(repo_dir: Path) -> str:
+    repo_dir = Path(repo_dir)
+    files = list(iter_code_files(repo_dir))
+    rel_files = {f.relative_to(repo_dir).as_posix() for f in files}
+    modules = {}
+    for rel in rel_files:
+        if rel.endswith(".py"):
+            dotted = rel[:-3].replace("/", ".")
+            modules[dotted.removesuffix(".__init__")] = rel
+            if dotted.startswith("src."):
+                modules[dotted[4:].removesuffix(".__init__")] = rel
+
+    loc_by_module, sizes, imported_by = Counter(), {}, defaultdict(set)
+    concurrency = defaultdict(Counter)
+    tests = Counter()
+    for path in files:
+        rel = path.relative_to(repo_dir)
+        source = path.read_text(encoding="utf-8", errors="replace")
+        loc = sum(1 for line in source.splitlines() if line.strip())
+        top = rel.parts[0] if len(rel.parts) > 1 else "(root)"
+        if top == "src" and len(rel.parts) > 2:
+            top = f"src/{rel.parts[1]}"
+        loc_by_module[top] += loc
+        sizes[rel.as_posix()] = loc
+        if re.search(r"(^|/)(tests?|__tests__|spec)(/|$)|(^|/)test_[^/]+$|_test\.\w+$|\.(test|spec)\.\w+$", rel.as_posix()):
+            tests[rel.parts[0] if len(rel.parts) > 1 else "(root)"] += 1
+        if path.suffix == ".py":
+            deps = _python_imports(source, rel, modules)
+        elif path.suffix in (".js", ".jsx", ".ts", ".tsx", ".mjs"):
+            deps = _js_imports(source, rel, rel_files)
+        else:
+            deps = set()
+        for dep in deps - {rel.as_posix()}:
+            imported_by[dep].add(rel.as_posix())
+        for kind, pattern in CONCURRENCY.items():
+            hits = len(pattern.findall(source))
+            if hits:
+                concurrency[kind][rel.as_posix()] += hits
+
+    lines = [f"Code files: {len(files)}, {sum(sizes.values())} non-blank lines"]
+    lines.append("LOC by module: " + ", ".join(f"{m} {n}" for m, n in loc_by_module.most_common(10)))
+    lines.append("Largest files: " + ", ".join(f"{f} ({n})" for f, n in sorted(sizes.items(), key=lambda x: -x[1])[:8]))
+    hubs = sorted(imported_by.items(), key=lambda x: -len(x[1]))[:8]
+    if hubs:
+        lines.append("Import hubs (imported by N files): " + ", ".join(f"{f} ({len(s)})" for f, s in hubs))
+    lines.extend(_dependencies(repo_dir) or ["No dependency manifest found"])
+    lines.append("Tests: " + (", ".join(f"{d} ({n} files)" for d, n in tests.most_common(5)) if tests else "none found"))
+    for kind, by_file in concurrency.items():
+        top_files = ", ".join(f"{f} ({n})" for f, n in by_file.most_common(3))
+        lines.append(f"{kind}: {sum(by_file.values())} uses in {len(by_file)} files, mostly {top_files}")
+    return "\n".join(lines)
+
+
+def fact_sheet(repo_dir: Path, cache_dir: Path = CACHE_DIR) -> str:
+    """Fact sheet for the checkout, reused from cache_dir when the commit was analyzed before"""
+    sha = commit_sha(repo_dir)
+    cache_file = Path(cache_dir) / f"{sha}.md"
+    if sha and cache_file.exists():
+        return cache_file.read_text(encoding="utf-8")
+    sheet = analyze(repo_dir)
+    if sha:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(sheet, encoding="utf-8")
+    return sheet
+
+
+if __name__ == "__main__":
+    print(fact_sheet(Path(sys.argv[1] if len(sys.argv) > 1 else ".")))
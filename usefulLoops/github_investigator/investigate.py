@@ -8,7 +8,21 @@ from polycli import OpenSourceAgent
 from polycli.orchestration import session, serve_session, pattern, batch
 from polycli.builtin_patterns import notify
 from pathlib import Path
-from pydantic import BaseModel, Field
+import argparse
+import difflib
+import json
+import sys
+import threading
+import time
+from pydantic import BaseModel, Field, ValidationError
+from typing import List
+
+from convergence import ConvergenceDetector
+from density import prefilter
+from doc_store import SectionStore
+from fact_sheet import fact_sheet
+from repo_cache import RepoCache, repo_slug
+from structured_output import recover_structured
 
 # Writer 1: User perspective
 USER_WRITER_PROMPT = """You investigate GitHub projects from a user's perspective.
@@ -23,7 +37,7 @@ You can clone repos, read code, run examples. Be specific:
 NOT: "Easy to use"
 BUT: "Takes 3 function calls vs FastAPI's 1, but gives you more control"
 
-Write findings to the project-prompt.md file directly."""
+Write findings to the file named in each task."""
 
 # Writer 2: Implementation perspective  
 IMPL_WRITER_PROMPT = """You investigate GitHub projects from an implementation perspective.
@@ -38,7 +52,7 @@ Clone the repo, read the core logic. Be specific:
 NOT: "Uses async/await"
 BUT: "Uses asyncio.gather without timeout - will deadlock if any task hangs"
 
-Write findings to the project-prompt.md file directly."""
+Write findings to the file named in each task."""
 
 # Critic: Aggressive editor with information theory
 CRITIC_PROMPT = """You are an aggressive editor who deletes obvious information.
@@ -60,6 +74,19 @@ class CriticFeedback(BaseModel):
     for_user_writer: str = Field(description="Specific investigation task for user perspective writer")
     for_impl_writer: str = Field(description="Specific investigation task for implementation writer")
 
+class LineRewrite(BaseModel):
+    """One line of the document replaced by a tighter version"""
+    old: str = Field(description="Exact existing line")
+    new: str = Field(description="Replacement line")
+
+# Combined critic output: document edits and writer tasks from a single call
+class CriticEdit(BaseModel):
+    """Edits to project-prompt.md plus specific tasks for each writer"""
+    delete_lines: List[str] = Field(default_factory=list, description="Exact lines of project-prompt.md to delete")
+    rewrite_lines: List[LineRewrite] = Field(default_factory=list, description="Lines to replace with a more specific version")
+    for_user_writer: str = Field(description="Specific investigation task for user perspective writer")
+    for_impl_writer: str = Field(description="Specific investigation task for implementation writer")
+
 # Meta-critic: Sanity checker (ephemeral)
 META_CRITIC_PROMPT = """You check if the critic is giving useful feedback to writers.
 
@@ -72,21 +99,34 @@ Check for:
 You see the critic's last few messages. Tell the critic how to improve their feedback.
 Focus on non-trivial improvements only."""
 
+def repo_location(checkout: Path = None) -> str:
+    """Where the writer finds the code: a cached local checkout, or clone it yourself"""
+    if checkout:
+        return f"It is already checked out at {checkout} (do not clone it again)."
+    return "Clone it."
+
 @pattern
-def investigate_user_perspective(writer: OpenSourceAgent, repo_url: str, prompt_file: Path) -> str:
+def investigate_user_perspective(writer: OpenSourceAgent, repo_url: str, prompt_file: Path,
+                                 checkout: Path = None, store: SectionStore = None) -> str:
     """Writer 1 investigates from user perspective"""
+    section = "User Perspective"
+    target = store.lease(section, "UserWriter") if store else prompt_file
     prompt = f"""Investigate this GitHub project: {repo_url}
 
-Clone it, read the README, try the examples, check the issues.
+{repo_location(checkout)} Read the README, try the examples, check the issues.
 Find specific details about the user experience.
 
-Write your findings to: {prompt_file}
-Format: ## User Perspective
+Write your findings to: {target}
+Format: ## {section}
 [specific findings]
 
 Focus on non-obvious details that affect actual usage."""
     
-    result = writer.run(prompt)
+    try:
+        result = writer.run(prompt)
+    finally:
+        if store:
+            store.commit(section, "UserWriter")
     if not result:
         return "Failed: No result from agent"
     if not result.is_success:
@@ -94,43 +134,139 @@ Focus on non-obvious details that affect actual usage."""
     return result.content if result.content else "No content returned"
 
 @pattern
-def investigate_implementation(writer: OpenSourceAgent, repo_url: str, prompt_file: Path) -> str:
+def investigate_implementation(writer: OpenSourceAgent, repo_url: str, prompt_file: Path,
+                               checkout: Path = None, store: SectionStore = None) -> str:
     """Writer 2 investigates implementation details"""
+    section = "Implementation Details"
+    target = store.lease(section, "ImplWriter") if store else prompt_file
     prompt = f"""Investigate this GitHub project: {repo_url}
 
-Clone it, read the core logic, check the dependencies, trace the data flow.
+{repo_location(checkout)} Read the core logic, check the dependencies, trace the data flow.
 Find specific implementation choices and trade-offs.
 
-Write your findings to: {prompt_file}
-Format: ## Implementation Details
+Write your findings to: {target}
+Format: ## {section}
 [specific findings]
 
 Focus on non-obvious technical decisions."""
     
-    result = writer.run(prompt)
+    try:
+        result = writer.run(prompt)
+    finally:
+        if store:
+            store.commit(section, "ImplWriter")
     if not result:
         return "Failed: No result from agent"
     if not result.is_success:
         return f"Failed: {result.error_message}"
     return result.content if result.content else "No content returned"
 
-@pattern
-def critique_and_refine(critic: OpenSourceAgent, prompt_file: Path) -> tuple:
-    """Critic edits the file and provides structured feedback"""
+def critic_baseline(prompt_file: Path) -> Path:
+    """Copy of the document as the critic left it after its last edit"""
+    return prompt_file.with_name(f".{prompt_file.stem}.critic-baseline.md")
+
+def critic_view(prompt_file: Path, can_read: bool = True) -> str:
+    """Full document the first time, afterwards only the diff since the critic's last edit"""
     current_content = prompt_file.read_text() if prompt_file.exists() else ""
+    baseline_file = critic_baseline(prompt_file)
+    if not baseline_file.exists():
+        return f"""Current project-prompt at {prompt_file}:
+
+{current_content}"""
+    diff = "".join(difflib.unified_diff(
+        baseline_file.read_text().splitlines(keepends=True), current_content.splitlines(keepends=True),
+        fromfile="after your last edit", tofile=str(prompt_file), n=2
+    ))
+    if not diff:
+        return f"{prompt_file} is unchanged since your last edit" + (" (re-read the file if you need it)." if can_read else ".")
+    return f"""Changes to {prompt_file} since your last edit{" (read the file for full context)" if can_read else ""}:
+
+{diff}"""
+
+def apply_critic_edit(prompt_file: Path, edit: CriticEdit) -> tuple:
+    """Apply line deletions/rewrites locally; headings are kept. Returns (deleted, rewritten, missed)."""
+    lines = prompt_file.read_text().splitlines()
+    keyed = [line.strip() for line in lines]
+    deleted, rewritten, missed = 0, 0, 0
+    for target in edit.delete_lines:
+        target = target.strip()
+        if target and not target.startswith("#") and target in keyed:
+            i = keyed.index(target)
+            del lines[i], keyed[i]
+            deleted += 1
+        elif target:
+            missed += 1
+    for rewrite in edit.rewrite_lines:
+        target = rewrite.old.strip()
+        if target and not target.startswith("#") and target in keyed:
+            i = keyed.index(target)
+            lines[i], keyed[i] = rewrite.new, rewrite.new.strip()
+            rewritten += 1
+        else:
+            missed += 1
+    prompt_file.write_text("\n".join(lines) + "\n")
+    return deleted, rewritten, missed
+
+def prefilter_document(prompt_file: Path) -> str:
+    """Prune near-free lines (they compress against generic prose + earlier text); note for the critic"""
+    if not prompt_file.exists():
+        return ""
+    text, pruned, flagged = prefilter(prompt_file.read_text())
+    if pruned:
+        prompt_file.write_text(text)
+        print(f"🗜️ Prefilter pruned {len(pruned)} low-information lines")
+    if not flagged:
+        return ""
+    return "\n\nLikely compressible (low information density) - delete unless you see something specific:\n" \
+        + "\n".join(f"- {line}" for line in flagged[:20])
+
+def critique_combined(critic: OpenSourceAgent, prompt_file: Path, note: str = ""):
+    """One no-tools critic call for both the edits and the writer tasks: (result, data) or None if unusable"""
+    prompt = f"""{critic_view(prompt_file, can_read=False)}
+
+Edit the document and direct the writers in one answer:
+1. delete_lines: exact lines that are generic/obvious or could describe any project
+2. rewrite_lines: lines worth keeping only in a more specific, compressed form
+3. for_user_writer / for_impl_writer: the specific non-trivial details each writer should find next
+Apply information theory: compressible = worthless.{note}"""
     
-    # First, edit the file with qwen-code
-    edit_prompt = f"""Current project-prompt at {prompt_file}:
+    result = critic.run(prompt, cli="no-tools", schema_cls=CriticEdit)
+    # Local JSON repair first; only the fields still failing are re-asked
+    data = recover_structured(result, CriticEdit, critic)
+    if not data:
+        return None
+    try:
+        edit = CriticEdit(**data)
+    except ValidationError as e:
+        print(f"⚠️ Combined critic output failed validation: {e.error_count()} errors")
+        return None
+    deleted, rewritten, missed = apply_critic_edit(prompt_file, edit)
+    print(f"✂️ Critic deleted {deleted} lines, rewrote {rewritten} ({missed} not found)")
+    critic_baseline(prompt_file).write_text(prompt_file.read_text())
+    return result, edit.model_dump()
 
-{current_content}
+@pattern
+def critique_and_refine(critic: OpenSourceAgent, prompt_file: Path, combined: bool = True) -> tuple:
+    """Critic edits the file and provides structured feedback: (edit_result, feedback dict or None)"""
+    note = prefilter_document(prompt_file)
+    if combined and prompt_file.exists():
+        combined_result = critique_combined(critic, prompt_file, note)
+        if combined_result is not None:
+            return combined_result
+        print("↩️ Falling back to separate edit and feedback calls")
+    
+    # First, edit the file with qwen-code
+    edit_prompt = f"""{critic_view(prompt_file)}
 
 Edit the file directly:
 1. Delete any generic/obvious lines 
 2. Apply information theory: compressible = worthless
 3. Keep only non-trivial, specific details
-4. Delete lines that could describe any project"""
+4. Delete lines that could describe any project{note}"""
     
     edit_result = critic.run(edit_prompt, cli="qwen-code")
+    if prompt_file.exists():
+        critic_baseline(prompt_file).write_text(prompt_file.read_text())
     
     # Then generate structured feedback for writers
     feedback_prompt = f"""Based on what's missing from the project investigation, 
@@ -138,7 +274,7 @@ Edit the file directly:
     
     feedback_result = critic.run(feedback_prompt, cli="no-tools", schema_cls=CriticFeedback)
     
-    return edit_result, feedback_result
+    return edit_result, recover_structured(feedback_result, CriticFeedback, critic)
 
 @pattern
 def check_critic_sanity(critic_messages: list) -> str:
@@ -161,98 +297,214 @@ Provide brief advice to improve the critic's feedback quality."""
     result = meta_critic.run(prompt, ephemeral=True)
     return result.content if result else ""
 
-def investigate_project(repo_url: str, max_rounds: int = 5):
-    """Main investigation loop"""
+OUTPUT_ROOT = Path("/home/jeffry/Codebase/PolyCLI-Benchmark/usefulLoops/github_investigator")
+
+def run_investigation(repo_url: str, max_rounds: int = 5, agent_suffix: str = "", combined_critic: bool = True,
+                      stop_on_convergence: bool = True) -> dict:
+    """Writer/critic rounds for one repo inside the current session; returns timing stats
+
+    combined_critic=True gets the critic's edits and writer tasks from one no-tools call
+    (applied and validated locally) instead of a qwen-code edit followed by a feedback call.
+    stop_on_convergence=True ends the rounds early once the document stops gaining new
+    content after the critic's cut (see convergence.py).
+    """
+    started = time.time()
     
     # Create agents
-    user_writer = OpenSourceAgent(id="UserWriter", system_prompt=USER_WRITER_PROMPT)
-    impl_writer = OpenSourceAgent(id="ImplWriter", system_prompt=IMPL_WRITER_PROMPT)
-    critic = OpenSourceAgent(id="Critic", system_prompt=CRITIC_PROMPT)
+    user_writer = OpenSourceAgent(id=f"UserWriter{agent_suffix}", system_prompt=USER_WRITER_PROMPT)
+    impl_writer = OpenSourceAgent(id=f"ImplWriter{agent_suffix}", system_prompt=IMPL_WRITER_PROMPT)
+    critic = OpenSourceAgent(id=f"Critic{agent_suffix}", system_prompt=CRITIC_PROMPT)
     
     # Setup output
-    output_dir = Path(f"/home/jeffry/Codebase/PolyCLI-Benchmark/usefulLoops/github_investigator/{repo_url.split('/')[-1]}")
+    output_dir = OUTPUT_ROOT / repo_slug(repo_url)   # owner_repo: same-named repos don't share drafts/worktrees
     output_dir.mkdir(parents=True, exist_ok=True)
     prompt_file = output_dir / "project-prompt.md"
+    print(f"🔍 Investigating: {repo_url}")
+    print(f"📁 Output: {prompt_file}\n")
+    
+    # One shared mirror per repo, one worktree per writer (fetched once per run)
+    checkouts = RepoCache().checkouts(repo_url, output_dir, ["user", "impl"])
+    # Each writer edits only its own section; drafts are merged back atomically
+    store = SectionStore(prompt_file)
     
     # Track critic messages for meta-critic
     critic_messages = []
+    round_seconds = []
+    convergence = ConvergenceDetector()
     
-    with session() as s:
-        server, _ = serve_session(s, port=8765)
-        print(f"🔍 Investigating: {repo_url}")
-        print(f"📊 Monitor at http://localhost:8765")
-        print(f"📁 Output: {prompt_file}\n")
+    # Initialize file
+    prompt_file.write_text(f"# Project Investigation: {repo_url}\n\n")
+    critic_baseline(prompt_file).unlink(missing_ok=True)
+    
+    notify(user_writer, f"Starting investigation of {repo_url} from user perspective")
+    notify(impl_writer, f"Starting investigation of {repo_url} from implementation perspective")
+    notify(critic, f"You'll be editing findings about {repo_url}")
+    
+    # Static pre-analysis (cached by commit SHA) so writers skip the orientation turns
+    if checkouts:
+        facts = fact_sheet(checkouts["impl"])
+        (output_dir / "facts.md").write_text(facts)
+        print(f"🧾 Fact sheet: {facts.count(chr(10)) + 1} lines")
+        for writer in (user_writer, impl_writer):
+            notify(writer, f"Static pre-analysis of the checked-out repo (already computed, no need to re-derive):\n{facts}")
+    
+    for round_num in range(1, max_rounds + 1):
+        round_start = time.time()
+        print(f"\n━━━ Round {round_num}/{max_rounds} ━━━")
         
-        # Initialize file
-        prompt_file.write_text(f"# Project Investigation: {repo_url}\n\n")
+        # Writers investigate in parallel
+        print("📝 Writers investigating...")
+        with batch():
+            user_findings = investigate_user_perspective(user_writer, repo_url, prompt_file, checkouts.get("user"), store)
+            impl_findings = investigate_implementation(impl_writer, repo_url, prompt_file, checkouts.get("impl"), store)
         
-        notify(user_writer, f"Starting investigation of {repo_url} from user perspective")
-        notify(impl_writer, f"Starting investigation of {repo_url} from implementation perspective")
-        notify(critic, f"You'll be editing findings about {repo_url}")
+        # Print FULL results for debugging
+        print("\n--- User Writer Result ---")
+        print(user_findings)
+        print("\n--- Impl Writer Result ---")
+        print(impl_findings)
+        print("---")
         
-        for round_num in range(1, max_rounds + 1):
-            print(f"\n━━━ Round {round_num}/{max_rounds} ━━━")
-            
-            # Writers investigate in parallel
-            print("📝 Writers investigating...")
-            with batch():
-                user_findings = investigate_user_perspective(user_writer, repo_url, prompt_file)
-                impl_findings = investigate_implementation(impl_writer, repo_url, prompt_file)
-            
-            # Print FULL results for debugging
-            print("\n--- User Writer Result ---")
-            print(user_findings)
-            print("\n--- Impl Writer Result ---")
-            print(impl_findings)
-            print("---")
+        # Critic reviews and refines
+        print("✂️ Critic reviewing...")
+        edit_result, feedback = critique_and_refine(critic, prompt_file, combined_critic)
+        
+        if feedback:
+            # Track messages for meta-critic
+            critic_messages.append(f"To user writer: {feedback['for_user_writer']}")
+            critic_messages.append(f"To impl writer: {feedback['for_impl_writer']}")
             
-            # Critic reviews and refines
-            print("✂️ Critic reviewing...")
-            edit_result, feedback_result = critique_and_refine(critic, prompt_file)
+            print(f"Critic edited file: {edit_result.content[:100] if edit_result else 'No changes'}...")
+            print(f"Critic to user writer: {feedback['for_user_writer']}")
+            print(f"Critic to impl writer: {feedback['for_impl_writer']}")
             
-            if feedback_result and feedback_result.has_data():
-                feedback = feedback_result.data
-                
-                # Track messages for meta-critic
-                critic_messages.append(f"To user writer: {feedback['for_user_writer']}")
-                critic_messages.append(f"To impl writer: {feedback['for_impl_writer']}")
-                
-                print(f"Critic edited file: {edit_result.content[:100] if edit_result else 'No changes'}...")
-                print(f"Critic to user writer: {feedback['for_user_writer']}")
-                print(f"Critic to impl writer: {feedback['for_impl_writer']}")
-                
-                # Send full feedback to writers (no truncation)
-                notify(user_writer, feedback['for_user_writer'])
-                notify(impl_writer, feedback['for_impl_writer'])
+            # Send full feedback to writers (no truncation)
+            notify(user_writer, feedback['for_user_writer'])
+            notify(impl_writer, feedback['for_impl_writer'])
+        
+        # Every 2 rounds, check critic's sanity
+        if round_num % 2 == 0 and len(critic_messages) >= 2:
+            print("🧠 Checking critic's sanity...")
+            sanity_check = check_critic_sanity(critic_messages)
             
-            # Every 2 rounds, check critic's sanity
-            if round_num % 2 == 0 and len(critic_messages) >= 2:
-                print("🧠 Checking critic's sanity...")
-                sanity_check = check_critic_sanity(critic_messages)
-                
-                if sanity_check:
-                    print(f"Meta-critic: {sanity_check[:200]}...")
-                    notify(critic, f"Meta-critic advises: {sanity_check}")
+            if sanity_check:
+                print(f"Meta-critic: {sanity_check[:200]}...")
+                notify(critic, f"Meta-critic advises: {sanity_check}")
+        round_seconds.append(round(time.time() - round_start, 1))
+        
+        gain = convergence.update(prompt_file.read_text())
+        print(f"📈 Information gain: {gain['novelty']:.0%} new shingles, {gain['churn']:.0%} lines changed")
+        if stop_on_convergence and convergence.converged and round_num < max_rounds:
+            print(f"🛑 Converged: {convergence.patience} low-gain rounds in a row, stopping early")
+            break
+    
+    # Final check
+    print("\n━━━ Final Review ━━━")
+    final_edit, _ = critique_and_refine(critic, prompt_file, combined_critic)
+    
+    stats = {
+        "repo_url": repo_url,
+        "status": "ok",
+        "output": str(prompt_file),
+        "rounds": len(round_seconds),
+        "round_seconds": round_seconds,
+        "information_gain": convergence.history,
+        "converged": convergence.converged,
+        "total_seconds": round(time.time() - started, 1),
+        "bytes": prompt_file.stat().st_size,
+        "finished_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    (output_dir / "stats.json").write_text(json.dumps(stats, indent=2, ensure_ascii=False))
+    print(f"\n✅ Investigation complete: {prompt_file} ({stats['total_seconds']:.0f}s)")
+    return stats
+
+def investigate_project(repo_url: str, max_rounds: int = 5, port: int = 8765):
+    """Main investigation loop"""
+    with session() as s:
+        server, _ = serve_session(s, port=port)
+        print(f"📊 Monitor at http://localhost:{port}")
         
-        # Final check
-        print("\n━━━ Final Review ━━━")
-        final_edit, _ = critique_and_refine(critic, prompt_file)
+        stats = run_investigation(repo_url, max_rounds)
         
-        print(f"\n✅ Investigation complete: {prompt_file}")
         print("\nGenerated project-prompt preview:")
         print("─" * 40)
-        final_content = prompt_file.read_text()
+        final_content = Path(stats["output"]).read_text()
         print(final_content[:1000] if len(final_content) > 1000 else final_content)
         
         input("\nPress Enter to stop monitoring...")
 
+def read_queue(queue_file: Path) -> list:
+    """Repo URLs from a queue file: one per line, # comments, duplicates dropped"""
+    urls = []
+    for line in Path(queue_file).read_text().splitlines():
+        url = line.split("#", 1)[0].strip()
+        if url and url not in urls:
+            urls.append(url)
+    return urls
+
+_results_lock = threading.Lock()
+
+@pattern
+def investigate_queued(repo_url: str, max_rounds: int, slots: threading.Semaphore, results_file: Path) -> dict:
+    """One queued investigation; waits for a free slot so at most N repos run at once"""
+    with slots:
+        try:
+            stats = run_investigation(repo_url, max_rounds, agent_suffix=f"-{repo_slug(repo_url)}")
+        except Exception as e:
+            stats = {"repo_url": repo_url, "status": "failed", "error": f"{type(e).__name__}: {e}",
+                     "finished_at": time.strftime("%Y-%m-%d %H:%M:%S")}
+            print(f"❌ {repo_url} failed: {stats['error']}")
+    with _results_lock:
+        with open(results_file, "a") as f:
+            f.write(json.dumps(stats, ensure_ascii=False) + "\n")
+    return stats
+
+def investigate_batch(queue_file: Path, max_rounds: int = 5, max_concurrent: int = 3, port: int = 8765):
+    """Headless: investigate every repo in queue_file, at most max_concurrent at a time"""
+    queue_file = Path(queue_file)
+    results_file = queue_file.with_suffix(".results.jsonl")
+    done = set()
+    if results_file.exists():
+        done = {r["repo_url"] for r in map(json.loads, results_file.read_text().splitlines()) if r["status"] == "ok"}
+    repo_urls = [url for url in read_queue(queue_file) if url not in done]
+    print(f"📋 {len(repo_urls)} repos queued ({len(done)} already done), {max_concurrent} at a time")
+    if not repo_urls:
+        return []
+    
+    slots = threading.Semaphore(max_concurrent)
+    started = time.time()
+    # Waiting investigations hold a worker each; running ones also need two for their writers
+    with session(max_workers=len(repo_urls) + 2 * max_concurrent) as s:
+        server, _ = serve_session(s, port=port)
+        print(f"📊 Monitor at http://localhost:{port}")
+        with batch():
+            results = [investigate_queued(url, max_rounds, slots, results_file) for url in repo_urls]
+    
+    ok = sum(1 for r in results if r.get("status") == "ok")
+    print(f"\n🏁 Batch done: {ok}/{len(results)} succeeded in {time.time() - started:.0f}s (see {results_file})")
+    return results
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="GitHub Project Investigator")
+    parser.add_argument("--queue", type=Path, help="file with one repo URL per line (headless batch mode)")
+    parser.add_argument("--rounds", type=int, help="max rounds per repo (default 5)")
+    parser.add_argument("--concurrency", type=int, default=3, help="repos investigated at once in batch mode")
+    parser.add_argument("--port", type=int, default=8765, help="monitor port")
+    args = parser.parse_args()
+    
+    if args.queue:
+        investigate_batch(args.queue, args.rounds or 5, args.concurrency, args.port)
+        sys.exit(0)
+    
     repo_url = input("GitHub repo URL: ").strip()
     if not repo_url:
         repo_url = "https://github.com/anthropics/anthropic-sdk-python"
         print(f"Using example: {repo_url}")
     
-    rounds = input("Max rounds (default 5): ").strip()
-    max_rounds = int(rounds) if rounds else 5
+    if args.rounds:
+        max_rounds = args.rounds
+    else:
+        rounds = input("Max rounds (default 5): ").strip()
+        max_rounds = int(rounds) if rounds else 5
     
-    investigate_project(repo_url, max_rounds)
\ No newline at end of file
+    investigate_project(repo_url, max_rounds, args.port)
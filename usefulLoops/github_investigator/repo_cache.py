@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Shared local git mirror cache for investigated repositories.
+
+Every repo URL gets one bare mirror under .git_mirrors/, fetched at most once per
+run (incrementally when it already exists from an earlier run). Each agent then
+reads its own worktree checked out from the mirror, so no agent has to clone.
+
+    python repo_cache.py https://github.com/owner/repo [dest]
+"""
+
+import hashlib
+import os
+import re
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+MIRROR_ROOT = Path(__file__).parent / ".git_mirrors"
+GIT_TIMEOUT = 600   # seconds; a clone or fetch stuck longer than this is treated as failed
+# Never prompt for credentials: a private or mistyped URL must fail, not wait on a tty forever
+GIT_ENV = {**os.environ, "GIT_TERMINAL_PROMPT": "0"}
+
+
+def _git(*args, cwd=None, timeout: int = GIT_TIMEOUT) -> str:
+    try:
+        result = subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True,
+                                env=GIT_ENV, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        raise RuntimeError(f"git {' '.join(args)} timed out after {timeout}s")
+    if result.returncode != 0:
+        raise RuntimeError(f"git {' '.join(args)} failed: {result.stderr.strip()}")
+    return result.stdout.strip()
+
+
+def _normalize(repo_url: str) -> str:
+    url = repo_url.strip().rstrip("/")
+    return url[:-4] if url.endswith(".git") else url
+
+
+def repo_slug(repo_url: str) -> str:
+    """owner_repo for a repo URL, so alice/utils and bob/utils never share a name"""
+    return re.sub(r"[^\w.-]+", "_", "/".join(_normalize(repo_url).split("/")[-2:]))
+
+
+def mirror_name(repo_url: str) -> str:
+    """Readable, collision-free directory name for a repo URL"""
+    url = _normalize(repo_url)
+    return f"{repo_slug(url)}-{hashlib.sha1(url.lower().encode()).hexdigest()[:8]}.git"
+
+
+class RepoCache:
+    """Bare mirrors keyed by repo URL plus per-agent worktrees created from them"""
+
+    def __init__(self, root: Path = MIRROR_ROOT):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._fetched = set()   # mirrors already brought up to date in this run
+        self._locks = {}
+        self._locks_guard = threading.Lock()
+
+    def _lock(self, path: Path) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(path, threading.Lock())
+
+    def mirror(self, repo_url: str) -> Path:
+        """Path of the up-to-date bare mirror (clone on first use, else incremental fetch)"""
+        path = self.root / mirror_name(repo_url)
+        with self._lock(path):
+            if path in self._fetched:
+                return path
+            if (path / "HEAD").exists():
+                print(f"🔄 Fetching {repo_url} into cached mirror...")
+                _git("remote", "update", "--prune", cwd=path)
+            else:
+                print(f"📥 Mirroring {repo_url} (first use)...")
+                _git("clone", "--mirror", repo_url, str(path))
+            self._fetched.add(path)
+        return path
+
+    def worktree(self, repo_url: str, dest: Path) -> Path:
+        """Detached checkout of the mirror's HEAD at dest (reset to HEAD if it already exists)"""
+        mirror = self.mirror(repo_url)
+        dest = Path(dest).resolve()
+        with self._lock(mirror):
+            head = _git("rev-parse", "HEAD", cwd=mirror)
+            if (dest / ".git").exists():
+                _git("checkout", "--detach", "--force", head, cwd=dest)
+                _git("clean", "-fdq", cwd=dest)
+            else:
+                _git("worktree", "prune", cwd=mirror)
+                _git("worktree", "add", "--detach", "--force", str(dest), head, cwd=mirror)
+        return dest
+
+    def checkouts(self, repo_url: str, base_dir: Path, names) -> dict:
+        """name -> worktree under base_dir for each agent; empty if the mirror can't be made"""
+        try:
+            return {name: self.worktree(repo_url, Path(base_dir) / f"repo_{name}") for name in names}
+        except RuntimeError as e:
+            print(f"⚠️ Repo cache unavailable, agents will clone themselves: {e}")
+            return {}
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python repo_cache.py <repo_url> [dest]")
+        sys.exit(1)
+    cache = RepoCache()
+    if len(sys.argv) > 2:
+        print(cache.worktree(sys.argv[1], Path(sys.argv[2])))
+    else:
+        print(cache.mirror(sys.argv[1]))
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Local JSON repair and validation for schema_cls structured outputs.
+Vendored copy of problemSolvingSystem/structured_output.py (each loop directory runs
+on its own); keep the two in sync.
+
+When a backend's structured reply fails to parse, result.data is None even though
+result.content usually holds almost-valid JSON. recover_structured() repairs the
+common defects locally (code fences, trailing commas, single quotes, Python
+literals, truncated arrays/objects, full-width Chinese punctuation), validates with
+the pydantic schema, and only re-asks the model for the fields that still fail.
+"""
+
+import json
+import re
+
+from pydantic import ValidationError, create_model
+
+FENCE = re.compile(r"```(?:json|JSON)?\s*\n?(.*?)(?:```|$)", re.S)
+FULLWIDTH = {"｛": "{", "｝": "}", "［": "[", "］": "]", "：": ":", "，": ","}
+CLOSERS = {"{": "}", "[": "]"}
+LITERALS = {"True": "true", "False": "false", "None": "null"}
+
+
+def strip_fences(text: str) -> str:
+    match = FENCE.search(text)
+    return match.group(1) if match else text
+
+
+def _close(out: str, stack: list) -> str:
+    out = out.rstrip()
+    while out.endswith(","):
+        out = out[:-1].rstrip()
+    if out.endswith(":"):
+        out += " null"
+    return out + "".join(reversed(stack))
+
+
+def repair_json(text: str) -> str:
+    """Best-effort rewrite of a model's almost-JSON into parseable JSON"""
+    text = strip_fences(text)
+    starts = [i for i in (text.find("{"), text.find("["), text.find("｛")) if i >= 0]
+    if not starts:
+        return text.strip()
+    out, stack, quote = [], [], None   # quote: characters that close the current string
+    i = min(starts)
+    while i < len(text):
+        c = text[i]
+        if quote:
+            if c == "\\" and i + 1 < len(text):
+                out.append(text[i:i + 2])
+                i += 2
+                continue
+            if c in quote:
+                out.append('"')
+                quote = None
+            elif c == '"':
+                out.append('\\"')
+            elif c == "\n":
+                out.append("\\n")
+            else:
+                out.append(c)
+        else:
+            c = FULLWIDTH.get(c, c)
+            if c == '"':
+                quote = '"'
+                out.append('"')
+            elif c in "“”":
+                quote = "”\""
+                out.append('"')
+            elif c == "'":
+                quote = "'"
+                out.append('"')
+            elif c in CLOSERS:
+                stack.append(CLOSERS[c])
+                out.append(c)
+            elif c in "}]":
+                while out and (out[-1].isspace() or out[-1] == ","):
+                    out.pop()  # trailing comma
+                if stack and stack[-1] == c:
+                    stack.pop()
+                    out.append(c)
+                if not stack:
+                    break
+            elif c.isalpha():
+                j = i
+                while j < len(text) and (text[j].isalnum() or text[j] == "_"):
+                    j += 1
+                word = text[i:j]
+                out.append(LITERALS.get(word, word))
+                i = j
+                continue
+            else:
+                out.append(c)
+        i += 1
+    if quote:
+        out.append('"')  # truncated inside a string
+    return _close("".join(out), stack)
+
+
+def loads_repaired(text: str):
+    """Parse text as JSON, repairing it if needed; trims a truncated tail as a last resort"""
+    try:
+        return json.loads(text)
+    except (json.JSONDecodeError, TypeError):
+        pass
+    repaired = repair_json(text or "")
+    for _ in range(20):
+        try:
+            return json.loads(repaired)
+        except json.JSONDecodeError:
+            # Drop the last (probably half-written) element and close again
+            cut = repaired.rstrip("}] \n").rfind(",")
+            if cut <= 0:
+                return None
+            repaired = repair_json(repaired[:cut])
+    return None
+
+
+def validate(obj, schema_cls):
+    """(data, failing_fields, valid_partial) for obj against schema_cls"""
+    if not isinstance(obj, dict):
+        return None, list(schema_cls.model_fields), {}
+    try:
+        return schema_cls(**obj).model_dump(), [], obj
+    except ValidationError as e:
+        failing = sorted({err["loc"][0] for err in e.errors() if err["loc"]})
+        partial = {k: v for k, v in obj.items() if k in schema_cls.model_fields and k not in failing}
+        return None, failing, partial
+
+
+def recover_structured(result, schema_cls, agent=None, **run_kwargs):
+    """Structured data for a schema_cls run: result.data, else local repair, else re-ask failing fields"""
+    if result is None:
+        return None
+    if result.data:
+        return result.data
+    if not (result.content or "").strip():
+        return None
+
+    data, failing, partial = validate(loads_repaired(result.content), schema_cls)
+    if data is not None:
+        print(f"🩹 Repaired malformed {schema_cls.__name__} JSON locally")
+        return data
+    if agent is None:
+        return None
+
+    # Ask only for the fields that are still missing or invalid
+    fields = {name: (schema_cls.model_fields[name].annotation, schema_cls.model_fields[name]) for name in failing}
+    fix_cls = create_model(f"{schema_cls.__name__}Fix", **fields)
+    print(f"🩹 Re-asking for {len(failing)}/{len(schema_cls.model_fields)} fields: {', '.join(failing)}")
+    fix = agent.run(
+        f"你上一次的结构化输出中这些字段缺失或格式错误：{', '.join(failing)}。只返回这些字段的 JSON。",
+        cli="no-tools", schema_cls=fix_cls, ephemeral=True, **run_kwargs
+    )
+    fix_data = recover_structured(fix, fix_cls) if fix is not None else None
+    if not fix_data:
+        return None
+    data, _, _ = validate({**partial, **fix_data}, schema_cls)
+    return data
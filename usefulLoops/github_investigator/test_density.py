@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""Checks for the density prefilter: what it may prune and what it must never touch"""
+
+from density import prefilter
+
+SNIPPET = """## Implementation Details
+
+```python
+client = httpx.Client(follow_redirects=True, timeout=None)
+async_client = httpx.AsyncClient(follow_redirects=True, timeout=None)
+```
+"""
+
+GENERIC = """## User Perspective
+
+This project is a simple, fast, lightweight and easy to use library with a clean API.
+This project is a simple, fast, lightweight and easy to use library with a clean API.
+"""
+
+
+def test_code_blocks_are_never_pruned():
+    text, pruned, flagged = prefilter(SNIPPET, prune_below=1.0, flag_below=1.0)
+    assert text == SNIPPET, pruned
+    assert not pruned and not flagged
+
+
+def test_generic_restatement_is_pruned():
+    text, pruned, _ = prefilter(GENERIC)
+    assert pruned, "a repeated line of generic prose should be pruned"
+    assert "## User Perspective" in text
+
+
+if __name__ == "__main__":
+    test_code_blocks_are_never_pruned()
+    test_generic_restatement_is_pruned()
+    print("density checks passed")
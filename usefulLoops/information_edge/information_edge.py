@@ -8,6 +8,8 @@ from polycli.orchestration import session, serve_session, pattern
 from polycli.builtin_patterns import notify
 from pathlib import Path
 
+from near_dup import FindingIndex, split_findings
+
 HUNTER_PROMPT = """You are an information edge hunter. Your goal is NOT to summarize or collect everything.
 Your goal is to find the 1% of information that gives 99% of the advantage.
 
@@ -34,9 +36,17 @@ Delete the noise. Keep only diamonds.
 Then think: what question would lead us to even rarer information?"""
 
 @pattern
-def hunt_for_edge(hunter: PolyAgent, topic: str, edge_file_path: Path, round_num: int) -> str:
-    """Hunt for one piece of rare information"""
+def hunt_for_edge(hunter: PolyAgent, topic: str, edge_file_path: Path, round_num: int,
+                  index: FindingIndex = None, max_attempts: int = 2) -> str:
+    """Hunt for one piece of rare information
+
+    With an index, the hunter writes to a candidate file; the finding is appended to
+    the edge file only if it is not a near-duplicate of an earlier one, otherwise the
+    hunter is told right away and tries again (up to max_attempts).
+    """
     current_edge = edge_file_path.read_text() if edge_file_path.exists() else "Empty"
+    target = edge_file_path.with_name("candidate.md") if index else edge_file_path
+    action = "write it to the file at" if index else "append it to the file at"
     
     prompt = f"""Topic: {topic}
 
@@ -49,12 +59,40 @@ Not summary. Not overview. One specific edge.
 Search the weird corners. The contrarian views. The insider knowledge.
 What would make someone say "I didn't know that, and it changes things"?
 
-After finding it, append it to the file at: {edge_file_path}
+After finding it, {action}: {target}
 Format: ## Round {round_num}
 [your rare finding]"""
     
-    result = hunter.run(prompt, cli="claude-code")
-    return result.content if result else ""
+    if not index:
+        result = hunter.run(prompt, cli="claude-code")
+        return result.content if result else ""
+    
+    for attempt in range(1, max_attempts + 1):
+        target.unlink(missing_ok=True)
+        result = hunter.run(prompt, cli="claude-code")
+        candidate = target.read_text().strip() if target.exists() else ""
+        findings = split_findings(candidate) or ([(f"Round {round_num}", candidate)] if candidate else [])
+        if not findings:
+            return result.content if result else ""
+        body = "\n\n".join(b for _, b in findings)
+        duplicate = index.find_duplicate(body)
+        if duplicate is None:
+            with open(edge_file_path, "a") as f:
+                f.write(f"\n## Round {round_num}\n\n{body}\n")
+            index.add(f"Round {round_num}", body)
+            target.unlink(missing_ok=True)
+            return result.content if result else ""
+        heading, old_body, similarity = duplicate
+        print(f"♻️ Rejected near-duplicate of ## {heading} ({similarity:.0%} similar), attempt {attempt}/{max_attempts}")
+        prompt = f"""Rejected: your finding is a near-duplicate ({similarity:.0%} similar) of an earlier one (## {heading}):
+{old_body[:600]}
+
+It was not added. Find ONE different piece of rare information about {topic} - a new thread, not a rephrasing.
+Write it to the file at: {target}
+Format: ## Round {round_num}
+[your rare finding]"""
+    target.unlink(missing_ok=True)
+    return f"No new finding in round {round_num}: {max_attempts} near-duplicates rejected"
 
 @pattern
 def refine_and_redirect(refiner: PolyAgent, edge_file_path: Path) -> str:
@@ -94,6 +132,8 @@ def edge_loop_with_session(topic: str, max_rounds: int = 10):
         
         # Initialize edge file
         edge_file.write_text(f"# Information Edge: {topic}\n\n")
+        # Rephrased rediscoveries are bounced back to the hunter instead of appended
+        findings = FindingIndex(topic)
         # notify(hunter, f"Starting hunt for information edge on: {topic}")
         # notify(refiner, f"You'll be refining information about: {topic}")
         
@@ -101,7 +141,7 @@ def edge_loop_with_session(topic: str, max_rounds: int = 10):
             print(f"\n───── Round {round_num} ─────")
             
             # Hunt for rare information (hunter will write to file directly)
-            edge_found = hunt_for_edge(hunter, topic, edge_file, round_num)
+            edge_found = hunt_for_edge(hunter, topic, edge_file, round_num, findings)
             
             if edge_found:
                 print(f"Hunter action: {edge_found[:200]}...")
@@ -111,6 +151,10 @@ def edge_loop_with_session(topic: str, max_rounds: int = 10):
             if round_num % 3 == 0:
                 print("\n🔍 Refining...")
                 suggestions = refine_and_redirect(refiner, edge_file)
+                # The refiner rewrites findings in place: index the new wording too
+                reindexed = findings.add_file(edge_file)
+                if reindexed:
+                    print(f"🔁 Indexed {reindexed} refined findings")
                 
                 if suggestions:
                     print(f"Refiner: {suggestions[:200]}...")
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate detection for information edge findings.
+
+Every accepted finding is indexed with a 64-bit SimHash (weighted word unigrams and
+bigrams) and a MinHash signature of its content words. A new finding is rejected when
+either similarity to an earlier one crosses its threshold, so a rephrased rediscovery
+is bounced straight back to the hunter instead of being cut by the refiner later.
+
+    python near_dup.py edge.md     # pairwise near-duplicates among existing findings
+"""
+
+import re
+import sys
+import zlib
+from collections import Counter
+from pathlib import Path
+
+WORD = re.compile(r"[a-z0-9][a-z0-9'+#.-]*|[一-鿿]", re.I)
+STOPWORDS = set("""a an the and or but if of to in on at by for with from as is are was were be been being
+it its this that these those there their they them we you your our i he she his her not no so than then
+can could would should will may might must do does did have has had into about over under more most very
+just also which who whom what when where why how all any each some such only own same other""".split())
+
+MASK64 = (1 << 64) - 1
+NUM_PERM = 64
+PRIME = (1 << 61) - 1
+PERMS = [((i * 0x9E3779B1 + 1) % PRIME | 1, (i * 0x85EBCA77 + 7) % PRIME) for i in range(1, NUM_PERM + 1)]
+
+
+def stem(word: str) -> str:
+    """Crude suffix stripping so 'capped'/'capping'/'caps' share a token"""
+    for suffix in ("ing", "ed", "es", "s"):
+        if len(word) > len(suffix) + 3 and word.endswith(suffix):
+            word = word[:-len(suffix)]
+            break
+    if len(word) > 4 and word[-1] == word[-2]:
+        word = word[:-1]
+    return word
+
+
+def content_words(text: str, ignore: frozenset = frozenset()) -> list:
+    words = [w.lower().strip(".-'") for w in WORD.findall(text)]
+    stems = [stem(w) for w in words if w and w not in STOPWORDS]
+    return [w for w in stems if w not in ignore]
+
+
+def _hash64(token: str) -> int:
+    data = token.encode("utf-8")
+    return (zlib.crc32(data) << 32 | zlib.crc32(data[::-1] + b"#")) & MASK64
+
+
+def simhash(text: str, ignore: frozenset = frozenset()) -> int:
+    words = content_words(text, ignore)
+    features = Counter(words) + Counter(f"{a} {b}" for a, b in zip(words, words[1:]))
+    weights = [0] * 64
+    for feature, count in features.items():
+        h = _hash64(feature)
+        for bit in range(64):
+            weights[bit] += count if h >> bit & 1 else -count
+    return sum(1 << bit for bit in range(64) if weights[bit] > 0)
+
+
+def simhash_similarity(a: int, b: int) -> float:
+    return 1.0 - bin(a ^ b).count("1") / 64
+
+
+def minhash(text: str, ignore: frozenset = frozenset()) -> list:
+    tokens = {zlib.crc32(w.encode("utf-8")) for w in content_words(text, ignore)}
+    if not tokens:
+        return [PRIME] * NUM_PERM
+    return [min((a * t + b) % PRIME for t in tokens) for a, b in PERMS]
+
+
+def minhash_similarity(a: list, b: list) -> float:
+    """Estimated Jaccard similarity of the two content-word sets"""
+    return sum(1 for x, y in zip(a, b) if x == y) / NUM_PERM
+
+
+def split_findings(text: str) -> list:
+    """(heading, body) for each '## ' section of an edge file"""
+    parts = re.split(r"^##\s+(.+?)\s*$", text, flags=re.M)
+    return [(parts[i], parts[i + 1].strip()) for i in range(1, len(parts) - 1, 2) if parts[i + 1].strip()]
+
+
+class FindingIndex:
+    """SimHash + MinHash index of accepted findings
+
+    topic words are ignored, since every finding on the topic shares them. SimHash catches
+    near-verbatim repeats; MinHash (content-word Jaccard) catches rephrasings, which in
+    practice score 0.3-0.5 against unrelated findings on the same topic at 0.0-0.15.
+    """
+
+    def __init__(self, topic: str = "", simhash_threshold: float = 0.9, minhash_threshold: float = 0.3,
+                 min_words: int = 5):
+        self.ignore = frozenset(stem(w.lower()) for w in WORD.findall(topic))
+        self.simhash_threshold = simhash_threshold
+        self.minhash_threshold = minhash_threshold
+        self.min_words = min_words   # too short to judge: never treated as a duplicate
+        self.entries = []            # (heading, body, simhash, minhash)
+
+    def add(self, heading: str, body: str):
+        self.entries.append((heading, body, simhash(body, self.ignore), minhash(body, self.ignore)))
+
+    def add_file(self, edge_file: Path) -> int:
+        """Index the findings of edge_file not indexed yet (e.g. ones the refiner rewrote); returns how many.
+        Entries whose finding was since deleted are kept, so a cut finding can't come back."""
+        if not Path(edge_file).exists():
+            return 0
+        known = {entry[1] for entry in self.entries}
+        added = 0
+        for heading, body in split_findings(Path(edge_file).read_text()):
+            if body not in known:
+                self.add(heading, body)
+                known.add(body)
+                added += 1
+        return added
+
+    def find_duplicate(self, body: str):
+        """(heading, body, similarity) of the closest earlier finding over a threshold, else None"""
+        if len(content_words(body, self.ignore)) < self.min_words:
+            return None
+        sig, mins = simhash(body, self.ignore), minhash(body, self.ignore)
+        best = None
+        for heading, old_body, old_sig, old_mins in self.entries:
+            sim_simhash = simhash_similarity(sig, old_sig)
+            sim_minhash = minhash_similarity(mins, old_mins)
+            if sim_simhash < self.simhash_threshold and sim_minhash < self.minhash_threshold:
+                continue
+            if best is None or sim_minhash > best[2]:
+                best = (heading, old_body, sim_minhash)
+        return best
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python near_dup.py <edge.md>")
+        sys.exit(1)
+    index = FindingIndex()
+    for heading, body in split_findings(Path(sys.argv[1]).read_text()):
+        dup = index.find_duplicate(body)
+        if dup:
+            print(f"## {heading} ~ ## {dup[0]} ({dup[2]:.0%})")
+        index.add(heading, body)
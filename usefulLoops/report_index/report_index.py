@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Full-text search over generated investigation and edge reports.
+
+Ingests github_investigator/<repo>/project-prompt.md and edge_<topic>/edge.md into a
+SQLite FTS5 index, one row per "## " section. Indexing is incremental: only files
+whose size/mtime changed are re-read, and only those whose content hash changed are
+re-split. Searching refreshes the index first, so results are never stale.
+
+    python report_index.py index [root ...]
+    python report_index.py search "asyncio deadlock" [--kind investigation|edge] [-n 10]
+    python report_index.py list
+"""
+
+import argparse
+import hashlib
+import re
+import sqlite3
+import sys
+from pathlib import Path
+
+DEFAULT_ROOT = Path(__file__).resolve().parent.parent   # usefulLoops/
+DB_FILE = Path(__file__).resolve().parent / "reports.db"
+
+REPORT_GLOBS = {
+    "investigation": "github_investigator/*/project-prompt.md",
+    "edge": "edge_*/edge.md",
+}
+TITLE = re.compile(r"^#\s+(?:Project Investigation|Information Edge):\s*(.+)$", re.M)
+SECTION = re.compile(r"^##\s+(.+?)\s*$", re.M)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    path TEXT PRIMARY KEY, kind TEXT, subject TEXT, mtime REAL, size INTEGER, sha TEXT
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS sections USING fts5(
+    subject, heading, body, path UNINDEXED, kind UNINDEXED, tokenize = 'porter unicode61'
+);
+"""
+
+
+def split_sections(text: str) -> list:
+    """(heading, body) pairs; text before the first '## ' becomes '(intro)'"""
+    matches = list(SECTION.finditer(text))
+    intro = TITLE.sub("", text[:matches[0].start()] if matches else text).strip()
+    sections = [("(intro)", intro)] if intro else []
+    for i, m in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+        body = text[m.end():end].strip()
+        if body:
+            sections.append((m.group(1), body))
+    return sections
+
+
+def connect(db_file: Path = DB_FILE) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_file)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def find_reports(roots) -> dict:
+    """path -> kind for every report file under the roots"""
+    reports = {}
+    for root in roots:
+        for kind, pattern in REPORT_GLOBS.items():
+            for path in Path(root).glob(pattern):
+                reports[str(path.resolve())] = kind
+    return reports
+
+
+def update_index(conn: sqlite3.Connection, roots=(DEFAULT_ROOT,)) -> dict:
+    """Bring the index in line with the files on disk; returns counts of what changed"""
+    reports = find_reports(roots)
+    known = {row[0]: row[1:] for row in conn.execute("SELECT path, mtime, size, sha FROM docs")}
+    counts = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+    with conn:
+        for path, kind in reports.items():
+            stat = Path(path).stat()
+            old = known.get(path)
+            if old and old[0] == stat.st_mtime and old[1] == stat.st_size:
+                counts["unchanged"] += 1
+                continue
+            text = Path(path).read_text(encoding="utf-8", errors="replace")
+            sha = hashlib.sha256(text.encode("utf-8")).hexdigest()
+            if old and old[2] == sha:
+                conn.execute("UPDATE docs SET mtime = ?, size = ? WHERE path = ?", (stat.st_mtime, stat.st_size, path))
+                counts["unchanged"] += 1
+                continue
+            title = TITLE.search(text)
+            subject = title.group(1).strip() if title else Path(path).parent.name
+            conn.execute("DELETE FROM sections WHERE path = ?", (path,))
+            conn.executemany(
+                "INSERT INTO sections (subject, heading, body, path, kind) VALUES (?, ?, ?, ?, ?)",
+                [(subject, heading, body, path, kind) for heading, body in split_sections(text)]
+            )
+            conn.execute("INSERT OR REPLACE INTO docs VALUES (?, ?, ?, ?, ?, ?)",
+                         (path, kind, subject, stat.st_mtime, stat.st_size, sha))
+            counts["updated" if old else "added"] += 1
+        for path in set(known) - set(reports):
+            if not any(Path(path).is_relative_to(Path(r).resolve()) for r in roots):
+                continue  # indexed from another root, leave it alone
+            conn.execute("DELETE FROM sections WHERE path = ?", (path,))
+            conn.execute("DELETE FROM docs WHERE path = ?", (path,))
+            counts["removed"] += 1
+    return counts
+
+
+def fts_query(text: str) -> str:
+    """Plain words -> AND of quoted terms; FTS5 syntax (quotes, AND/OR/NEAR, *) passes through"""
+    if re.search(r'["*]|\b(?:AND|OR|NOT|NEAR)\b', text):
+        return text
+    return " ".join(f'"{word}"' for word in re.findall(r"\w+", text))
+
+
+def search(conn: sqlite3.Connection, query: str, kind: str = None, limit: int = 10) -> list:
+    """Best-matching sections (bm25) as dicts with subject, heading, path and a snippet"""
+    sql = """SELECT subject, heading, path, kind, snippet(sections, 2, '[', ']', ' … ', 16), bm25(sections)
+             FROM sections WHERE sections MATCH ?"""
+    params = [fts_query(query)]
+    if kind:
+        sql += " AND kind = ?"
+        params.append(kind)
+    sql += " ORDER BY bm25(sections) LIMIT ?"
+    params.append(limit)
+    keys = ("subject", "heading", "path", "kind", "snippet", "score")
+    return [dict(zip(keys, row)) for row in conn.execute(sql, params)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Search generated investigation and edge reports")
+    # --db is accepted after the subcommand too (report_index.py search --db x ...)
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--db", type=Path, default=DB_FILE, help=f"index database (default {DB_FILE.name})")
+    sub = parser.add_subparsers(dest="command", required=True)
+    index_cmd = sub.add_parser("index", parents=[common], help="(re)index report files")
+    index_cmd.add_argument("roots", nargs="*", type=Path, default=[DEFAULT_ROOT])
+    search_cmd = sub.add_parser("search", parents=[common], help="full-text search over report sections")
+    search_cmd.add_argument("query")
+    search_cmd.add_argument("--kind", choices=sorted(REPORT_GLOBS))
+    search_cmd.add_argument("-n", type=int, default=10)
+    search_cmd.add_argument("--root", type=Path, action="append")
+    sub.add_parser("list", parents=[common], help="list indexed reports")
+    args = parser.parse_args()
+
+    conn = connect(args.db)
+    if args.command == "index":
+        counts = update_index(conn, args.roots)
+        print(", ".join(f"{v} {k}" for k, v in counts.items()))
+    elif args.command == "search":
+        update_index(conn, args.root or [DEFAULT_ROOT])
+        try:
+            results = search(conn, args.query, args.kind, args.n)
+        except sqlite3.OperationalError as e:
+            print(f"Bad query: {e}")
+            sys.exit(1)
+        for r in results:
+            print(f"[{r['kind']}] {r['subject']} — ## {r['heading']}\n    {r['snippet']}\n    {r['path']}")
+        if not results:
+            print("No matches.")
+    else:
+        for kind, subject, path in conn.execute("SELECT kind, subject, path FROM docs ORDER BY kind, subject"):
+            print(f"[{kind}] {subject}: {path}")
+
+
+if __name__ == "__main__":
+    main()